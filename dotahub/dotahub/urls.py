@@ -8,6 +8,8 @@ from wagtail.contrib.sitemaps.views import sitemap
 from wagtail.core import urls as wagtail_urls
 from wagtail.documents import urls as wagtaildocs_urls
 
+from home.listing import views as listing_views
+from home.videos import views as video_views
 from search import views as search_views
 
 from .api import api_router
@@ -18,6 +20,8 @@ urlpatterns = [
     url(r'^admin/', include(wagtailadmin_urls)),
     url(r'^documents/', include(wagtaildocs_urls)),
     url(r'^api/v2/', api_router.urls),
+    url(r'^search/autocomplete/$', search_views.autocomplete, name='autocomplete'),
+    url(r'^media-stream/(?P<media_id>\d+)/$', video_views.serve_media, name='serve_media'),
     url(r'^sitemap\.xml$', sitemap),
 
 ]
@@ -25,6 +29,7 @@ urlpatterns = [
 urlpatterns += i18n_patterns(
 
     url(r'^search/$', search_views.search, name='search'),
+    url(r'^listing/(?P<page_id>\d+)/fragment/$', listing_views.fragment, name='listing_fragment'),
     url(r'', include(wagtail_urls)),
 
 )
@@ -1,15 +1,18 @@
+import json
+
 from django.db import models
 from wagtail.admin.edit_handlers import MultiFieldPanel, RichTextFieldPanel, StreamFieldPanel
 from wagtail.core.fields import RichTextField, StreamField
 from wagtail.snippets.models import register_snippet
 
-from ..modules import text_processing
 from .. import configurations
+from ..blogs import outline
 from ..blogs.blocks import SectionBlock
+from ..plain_text.models import PlainTextColumnsMixin
 
 
 @register_snippet
-class BlogPost(models.Model):
+class BlogPost(PlainTextColumnsMixin, models.Model):
     post_title = RichTextField(
         features=[], blank=False, null=True,
     )
@@ -28,6 +31,20 @@ class BlogPost(models.Model):
         ], blank=False
     )
 
+    post_title_text = models.TextField(default='', editable=False)
+    post_summary_text = models.TextField(default='', editable=False)
+    post_title_short = models.CharField(max_length=70, default='', editable=False)
+    post_summary_short = models.CharField(max_length=250, default='', editable=False)
+    section_outline = models.TextField(default='[]', editable=False)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    plain_text_columns = {
+        'post_title_text': ('post_title', None),
+        'post_summary_text': ('post_summary', None),
+        'post_title_short': ('post_title', 70),
+        'post_summary_short': ('post_summary', 250),
+    }
+
     panels = [
         MultiFieldPanel(
             [
@@ -40,15 +57,31 @@ class BlogPost(models.Model):
         ),
     ]
 
+    def refresh_section_outline(self):
+        self._outline = outline.get_section_outline(self.sections.get_prep_value())
+        self.section_outline = json.dumps(self._outline, ensure_ascii=False)
+
+    @property
+    def outline(self):
+        if '_outline' not in self.__dict__:
+            sections = json.loads(self.section_outline)
+            # rows saved before the outline existed fall back to the stream until backfilled
+            if len(sections) != len(self.sections.stream_data):
+                sections = outline.get_section_outline(self.sections.get_prep_value())
+            self._outline = sections
+        return self._outline
+
     @property
     def sections_with_title(self):
-        sections = []
-        for section in self.sections:
-            if section.value['title']:
-                sections.append(section)
-        return sections
+        return [section for section in self.outline if section['title']]
+
+    @property
+    def outlined_sections(self):
+        return zip(self.sections, self.outline)
+
+    def save(self, *args, **kwargs):
+        self.refresh_section_outline()
+        super().save(*args, **kwargs)
 
     def __str__(self):
-        return text_processing.html_to_str(
-            self.post_title
-        )
+        return self.post_title_text
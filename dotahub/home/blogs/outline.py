@@ -0,0 +1,36 @@
+from ..modules import text_processing
+
+
+def get_anchor(title):
+    return title.replace(' ', '_')
+
+
+def get_block_texts(block_type, value):
+    if block_type == 'text':
+        return [value]
+    texts = [value.get('paragraph')]
+    if block_type in ('UL', 'OL'):
+        texts += value.get('items') or []
+    return texts
+
+
+def count_words(html):
+    return len(text_processing.html_to_str(html or '').split())
+
+
+def get_section_outline(stream_data):
+    # works on the raw stream data, so sections are never turned into blocks
+    outline = []
+    for section in stream_data:
+        value = section['value']
+        title = text_processing.html_to_str(value.get('title') or '')
+        words = 0
+        for child in value.get('content') or []:
+            for text in get_block_texts(child['type'], child['value']):
+                words += count_words(text)
+        outline.append({
+            'title': title,
+            'anchor': get_anchor(title),
+            'words': words,
+        })
+    return outline
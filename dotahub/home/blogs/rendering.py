@@ -0,0 +1,60 @@
+from django.core.cache import cache
+from django.template.loader import render_to_string
+from django.utils.safestring import mark_safe
+
+from ..modules import image_formats, process_cache
+
+BODY_TEMPLATE = 'home/posts/alldota_posts/post_page/body.html'
+BODY_TIMEOUT = 60 * 60 * 24 * 7
+IMAGE_VERSION_KEY = 'blog-body-images'
+# rich text links are expanded to page urls, so url changes also retire bodies
+URL_VERSION_KEY = 'multilingual-url-map'
+STATS_KEY = 'blog-body-cache:{}'
+STATS = ('hits', 'misses')
+
+
+def get_content(page, language):
+    if language == 'fa':
+        return page.farsi_content
+    if language == 'en':
+        return page.english_content
+    return None
+
+
+def get_cache_key(blog_post, language, image_format):
+    return 'blog-body:{}:{}:{}:{}:{}:{}'.format(
+        blog_post.pk, int(blog_post.updated_at.timestamp() * 1000000), language, image_format,
+        process_cache.get_version(IMAGE_VERSION_KEY), process_cache.get_version(URL_VERSION_KEY),
+    )
+
+
+def count(stat):
+    try:
+        cache.incr(STATS_KEY.format(stat))
+    except ValueError:
+        cache.set(STATS_KEY.format(stat), 1, None)
+
+
+def get_stats():
+    values = cache.get_many([STATS_KEY.format(stat) for stat in STATS])
+    return {stat: values.get(STATS_KEY.format(stat), 0) for stat in STATS}
+
+
+def reset_stats():
+    cache.delete_many([STATS_KEY.format(stat) for stat in STATS])
+
+
+def render_post_body(page, request):
+    language = page.template_language
+    blog_post = get_content(page, language)
+    if blog_post is None:
+        return ''
+    key = get_cache_key(blog_post, language, image_formats.get_image_format(request))
+    html = cache.get(key)
+    if html is None:
+        count('misses')
+        html = render_to_string(BODY_TEMPLATE, {'page': page}, request=request)
+        cache.set(key, html, BODY_TIMEOUT)
+    else:
+        count('hits')
+    return mark_safe(html)
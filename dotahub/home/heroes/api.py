@@ -1,7 +1,83 @@
+from django.conf.urls import url
+from rest_framework.response import Response
 from wagtail.api.v2.endpoints import BaseAPIEndpoint
+from wagtail.api.v2.filters import FieldsFilter, OrderingFilter
+from wagtail.api.v2.utils import BadRequestError
 
+from ..modules import image_formats
+from . import facets
+from .levels import MAX_LEVEL, get_level_table
 from .models import Hero
 
+FACET_PREFIX = 'facet_'
+
 
 class HeroAPIEndpoint(BaseAPIEndpoint):
     model = Hero
+    filter_backends = [
+        FieldsFilter,
+        OrderingFilter,
+    ]
+    known_query_parameters = BaseAPIEndpoint.known_query_parameters.union(
+        [FACET_PREFIX + facet for facet in facets.FACETS],
+        [image_formats.IMAGE_FORMAT_PARAMETER],
+    )
+
+    def get_queryset(self):
+        return super().get_queryset().select_related('hero_type')
+
+    def get_facet_selection(self):
+        return facets.get_selection(self.request.GET, prefix=FACET_PREFIX)
+
+    def filter_queryset(self, queryset):
+        queryset = super().filter_queryset(queryset)
+        selection = self.get_facet_selection()
+        if selection:
+            index = facets.get_facet_index()
+            queryset = queryset.filter(
+                pk__in=index.get_hero_ids(index.filter(selection))
+            )
+        return queryset
+
+    def get_paginated_response(self, data):
+        response = super().get_paginated_response(data)
+        response.data['meta']['facets'] = facets.get_facet_index().get_counts(
+            self.get_facet_selection()
+        )
+        return response
+
+    def paginate_queryset(self, queryset):
+        heroes = list(super().paginate_queryset(queryset))
+        Hero.prefetch_related_snippets(heroes)
+        return heroes
+
+    def get_serializer_context(self):
+        context = super().get_serializer_context()
+        image_format = self.request.GET.get(image_formats.IMAGE_FORMAT_PARAMETER)
+        if image_format is not None and image_format not in image_formats.MIME_TYPES:
+            raise BadRequestError('{} must be one of: {}'.format(
+                image_formats.IMAGE_FORMAT_PARAMETER, ', '.join(sorted(image_formats.MIME_TYPES))
+            ))
+        context['image_format'] = image_format
+        return context
+
+    def levels_view(self, request):
+        table = get_level_table()
+        level = request.GET.get('level')
+        if level is None:
+            return Response(table.get_table())
+        try:
+            level = int(level)
+        except ValueError:
+            raise BadRequestError('level must be an integer')
+        if not 1 <= level <= MAX_LEVEL:
+            raise BadRequestError(
+                'level must be between 1 and {}'.format(MAX_LEVEL)
+            )
+        return Response(table.get_level(level))
+
+    @classmethod
+    def get_urlpatterns(cls):
+        return super().get_urlpatterns() + [
+            url(r'^levels/$', cls.as_view({'get': 'levels_view'}), name='levels'),
+        ]
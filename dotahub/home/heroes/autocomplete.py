@@ -0,0 +1,76 @@
+import re
+
+from ..modules import process_cache
+from .models import Ability, Hero
+
+MAX_RESULTS = 10
+
+# Farsi text is typed with both the Arabic and the Persian forms of some letters.
+CHARACTER_MAP = str.maketrans({
+    'ي': 'ی',
+    'ى': 'ی',
+    'ك': 'ک',
+    'ة': 'ه',
+    'أ': 'ا',
+    'إ': 'ا',
+    'آ': 'ا',
+    '\u200c': ' ',
+})
+
+
+def tokenize(text):
+    return re.findall(r'\w+', text.translate(CHARACTER_MAP).lower())
+
+
+class AutocompleteIndex:
+    def __init__(self):
+        self.entries = []
+        self.prefixes = {}
+
+    def add(self, entry, *names):
+        position = len(self.entries)
+        self.entries.append(entry)
+        for name in names:
+            for token in tokenize(name or ''):
+                for end in range(1, len(token) + 1):
+                    self.prefixes.setdefault(token[:end], set()).add(position)
+
+    def search(self, query, limit=MAX_RESULTS):
+        matches = None
+        for token in tokenize(query):
+            positions = self.prefixes.get(token, set())
+            matches = positions if matches is None else matches & positions
+            if not matches:
+                return []
+        if matches is None:
+            return []
+        return [self.entries[position] for position in sorted(matches)[:limit]]
+
+    @classmethod
+    def build(cls):
+        index = cls()
+        heroes = Hero.objects.order_by('-popularity', 'name').values_list(
+            'id', 'name', 'farsi_name'
+        )
+        for hero_id, name, farsi_name in heroes:
+            index.add(
+                {
+                    'type': 'hero',
+                    'id': hero_id,
+                    'name': name,
+                    'farsi_name': farsi_name,
+                }, name, farsi_name
+            )
+        for ability_id, name in Ability.objects.values_list('id', 'name'):
+            index.add(
+                {
+                    'type': 'ability',
+                    'id': ability_id,
+                    'name': name,
+                }, name
+            )
+        return index
+
+
+def get_autocomplete_index():
+    return process_cache.get('autocomplete-index', AutocompleteIndex.build)
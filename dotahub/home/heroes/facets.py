@@ -0,0 +1,107 @@
+from urllib.parse import urlencode
+
+from django.db.models import prefetch_related_objects
+
+from ..modules import process_cache, streams
+from .models import Hero, HeroRole
+
+FACETS = ('ego', 'hero_type', 'attack_type', 'role')
+
+
+def count_bits(bitset):
+    return bin(bitset).count('1')
+
+
+def get_selection(query_dict, prefix=''):
+    selection = {}
+    for facet in FACETS:
+        values = []
+        for value in query_dict.getlist(prefix + facet):
+            values += [item for item in value.split(',') if item]
+        if values:
+            selection[facet] = values
+    return selection
+
+
+class HeroFacetIndex:
+    def __init__(self, hero_ids, bitsets):
+        self.hero_ids = hero_ids
+        # one bitset per facet value, bit n set when the nth hero has that value
+        self.bitsets = bitsets
+        self.all_heroes = (1 << len(hero_ids)) - 1
+
+    @classmethod
+    def build(cls):
+        heroes = list(Hero.objects.select_related('hero_type').order_by('name'))
+        prefetch_related_objects(heroes, 'attack_types')
+        streams.prefetch_snippets(heroes, 'roles', 'role', HeroRole.objects.all())
+        bitsets = {facet: {} for facet in FACETS}
+        for position, hero in enumerate(heroes):
+            hero_values = {
+                'ego': [hero.ego],
+                'hero_type': [hero.group] if hero.hero_type else [],
+                'attack_type': hero.hero_attack_types,
+                'role': hero.hero_roles,
+            }
+            for facet, values in hero_values.items():
+                for value in values:
+                    if value:
+                        bitsets[facet][value] = bitsets[facet].get(value, 0) | (1 << position)
+        return cls([hero.pk for hero in heroes], bitsets)
+
+    def filter(self, selection):
+        result = self.all_heroes
+        for facet, values in selection.items():
+            facet_bitset = 0
+            for value in values:
+                facet_bitset |= self.bitsets[facet].get(value, 0)
+            result &= facet_bitset
+        return result
+
+    def get_hero_ids(self, bitset):
+        return [
+            hero_id for position, hero_id in enumerate(self.hero_ids)
+            if bitset >> position & 1
+        ]
+
+    def get_counts(self, selection):
+        counts = {}
+        for facet in FACETS:
+            # values of one facet are OR-ed, so count them against the other facets only
+            other_facets = self.filter({
+                other: values for other, values in selection.items() if other != facet
+            })
+            counts[facet] = {
+                value: count_bits(bitset & other_facets)
+                for value, bitset in sorted(self.bitsets[facet].items())
+            }
+        return counts
+
+    def get_links(self, selection):
+        links = []
+        for facet, counts in self.get_counts(selection).items():
+            values = []
+            for value, count in counts.items():
+                selected = value in selection.get(facet, [])
+                toggled_selection = dict(selection)
+                toggled_values = [
+                    item for item in selection.get(facet, []) if item != value
+                ]
+                if not selected:
+                    toggled_values.append(value)
+                toggled_selection[facet] = toggled_values
+                values.append({
+                    'value': value,
+                    'count': count,
+                    'selected': selected,
+                    'query': urlencode({
+                        name: ','.join(items)
+                        for name, items in toggled_selection.items() if items
+                    }),
+                })
+            links.append({'name': facet, 'values': values})
+        return links
+
+
+def get_facet_index():
+    return process_cache.get('hero-facet-index', HeroFacetIndex.build)
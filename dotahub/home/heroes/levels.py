@@ -0,0 +1,72 @@
+import numpy
+
+from ..modules import process_cache
+from .models import Hero
+
+MAX_LEVEL = 30
+
+ATTRIBUTES = ('strength', 'agility', 'intelligence')
+
+
+class HeroLevelTable:
+    def __init__(self, hero_ids, hero_names, stats):
+        self.hero_ids = hero_ids
+        self.hero_names = hero_names
+        # shape: (heroes, levels, attributes)
+        self.stats = stats
+
+    @classmethod
+    def build(cls):
+        columns = []
+        for attribute in ATTRIBUTES:
+            columns += ['{}_base'.format(attribute), '{}_per_level'.format(attribute)]
+        rows = list(Hero.objects.values_list('id', 'name', *columns))
+        values = numpy.array(
+            [row[2:] for row in rows], dtype=float
+        ).reshape(len(rows), len(ATTRIBUTES), 2)
+        base = values[:, :, 0]
+        per_level = values[:, :, 1]
+        gained_levels = numpy.arange(MAX_LEVEL, dtype=float)
+        stats = (
+            base[:, numpy.newaxis, :] +
+            gained_levels[numpy.newaxis, :, numpy.newaxis] * per_level[:, numpy.newaxis, :]
+        )
+        return cls(
+            [row[0] for row in rows], [row[1] for row in rows], stats
+        )
+
+    @staticmethod
+    def to_json(values):
+        values = numpy.round(values, 2).astype(object)
+        values[numpy.isnan(values.astype(float))] = None
+        return values.tolist()
+
+    def get_level(self, level):
+        stats = self.to_json(self.stats[:, level - 1, :])
+        return {
+            'level': level,
+            'attributes': ATTRIBUTES,
+            'heroes': [
+                dict(id=hero_id, name=name, **dict(zip(ATTRIBUTES, hero_stats)))
+                for hero_id, name, hero_stats in zip(self.hero_ids, self.hero_names, stats)
+            ]
+        }
+
+    def get_table(self):
+        stats = self.to_json(self.stats)
+        return {
+            'levels': list(range(1, MAX_LEVEL + 1)),
+            'attributes': ATTRIBUTES,
+            'heroes': [
+                {
+                    'id': hero_id,
+                    'name': name,
+                    'stats': hero_stats,
+                }
+                for hero_id, name, hero_stats in zip(self.hero_ids, self.hero_names, stats)
+            ]
+        }
+
+
+def get_level_table():
+    return process_cache.get('hero-level-table', HeroLevelTable.build)
@@ -1,10 +1,10 @@
 from django import forms
 from django.db import models
+from django.db.models import prefetch_related_objects
 from wagtail.admin.edit_handlers import MultiFieldPanel, FieldRowPanel, FieldPanel, StreamFieldPanel, RichTextFieldPanel
 from wagtail.api import APIField
 from wagtail.core.blocks import StreamBlock
 from wagtail.core.fields import StreamField, RichTextField
-from wagtail.images.api.fields import ImageRenditionField
 from wagtail.images.edit_handlers import ImageChooserPanel
 from wagtail.snippets.blocks import SnippetChooserBlock
 from wagtail.snippets.edit_handlers import SnippetChooserPanel
@@ -12,8 +12,9 @@ from wagtail.snippets.models import register_snippet
 from wagtail.search import index
 
 from .blocks import *
+from .serializers import HeroStatField, NegotiatedImageRenditionField
 from .. import configurations
-from ..modules import wagtail_images
+from ..modules import process_cache, streams, wagtail_images
 
 
 class HeroPropertyImage(models.Model):
@@ -51,31 +52,46 @@ class HeroPropertyImage(models.Model):
         ImageChooserPanel('armor'),
     ]
 
+    @classmethod
+    def load(cls):
+        return cls.objects.select_related(
+            'intelligence', 'agility', 'strength',
+            'damage', 'move_speed', 'armor',
+        ).first()
+
+    @classmethod
+    def get_cached(cls):
+        return process_cache.get('hero-property-image', cls.load)
+
 
 class HeroesPageMixin:
+    @property
+    def hero_property_image(self):
+        return HeroPropertyImage.get_cached()
+
     @property
     def intelligence_image(self):
-        return HeroPropertyImage.objects.first().intelligence
+        return self.hero_property_image.intelligence
 
     @property
     def agility_image(self):
-        return HeroPropertyImage.objects.first().agility
+        return self.hero_property_image.agility
 
     @property
     def strength_image(self):
-        return HeroPropertyImage.objects.first().strength
+        return self.hero_property_image.strength
 
     @property
     def damage_image(self):
-        return HeroPropertyImage.objects.first().damage
+        return self.hero_property_image.damage
 
     @property
     def move_speed_image(self):
-        return HeroPropertyImage.objects.first().move_speed
+        return self.hero_property_image.move_speed
 
     @property
     def armor_image(self):
-        return HeroPropertyImage.objects.first().armor
+        return self.hero_property_image.armor
 
 
 class HeroCategory(models.Model):
@@ -248,23 +264,63 @@ class Hero(models.Model):
     )
     instagram_ready = models.BooleanField(default=False)
 
+    intelligence_base = models.IntegerField(null=True, editable=False, db_index=True)
+    intelligence_per_level = models.FloatField(null=True, editable=False, db_index=True)
+    agility_base = models.IntegerField(null=True, editable=False, db_index=True)
+    agility_per_level = models.FloatField(null=True, editable=False, db_index=True)
+    strength_base = models.IntegerField(null=True, editable=False, db_index=True)
+    strength_per_level = models.FloatField(null=True, editable=False, db_index=True)
+    damage_min = models.IntegerField(null=True, editable=False, db_index=True)
+    damage_max = models.IntegerField(null=True, editable=False, db_index=True)
+    move_speed_value = models.IntegerField(null=True, editable=False, db_index=True)
+    armor_value = models.FloatField(null=True, editable=False, db_index=True)
+
+    stat_columns = {
+        'intelligence': {'base': 'intelligence_base', 'per_level': 'intelligence_per_level'},
+        'agility': {'base': 'agility_base', 'per_level': 'agility_per_level'},
+        'strength': {'base': 'strength_base', 'per_level': 'strength_per_level'},
+        'damage': {'min': 'damage_min', 'max': 'damage_max'},
+        'move_speed': {'speed': 'move_speed_value'},
+        'armor': {'armor': 'armor_value'},
+    }
+
+    @classmethod
+    def get_stat_column_names(cls):
+        return [
+            column for columns in cls.stat_columns.values()
+            for column in columns.values()
+        ]
+
+    def refresh_stat_columns(self):
+        for stat, columns in self.stat_columns.items():
+            stream = getattr(self, stat)
+            value = stream[0].value if stream else {}
+            for key, column in columns.items():
+                setattr(self, column, value.get(key))
+
+    def get_stat(self, stat):
+        return {
+            key: getattr(self, column)
+            for key, column in self.stat_columns[stat].items()
+        }
+
     def get_intelligence(self):
-        return self.intelligence[0].value
+        return self.get_stat('intelligence')
 
     def get_agility(self):
-        return self.agility[0].value
+        return self.get_stat('agility')
 
     def get_strength(self):
-        return self.strength[0].value
+        return self.get_stat('strength')
 
     def get_damage(self):
-        return self.damage[0].value
+        return self.get_stat('damage')
 
     def get_move_speed(self):
-        return self.move_speed[0].value
+        return self.get_stat('move_speed')
 
     def get_armor(self):
-        return self.armor[0].value
+        return self.get_stat('armor')
 
     panels = [
         MultiFieldPanel(
@@ -343,11 +399,21 @@ class Hero(models.Model):
     @property
     def hero_roles(self):
         return [
-            role.value.name for role in self.roles
+            role.value.name for role in self.roles if role.value
         ]
 
+    @staticmethod
+    def prefetch_related_snippets(heroes):
+        prefetch_related_objects(heroes, 'attack_types')
+        streams.prefetch_snippets(
+            heroes, 'roles', 'role', HeroRole.objects.all()
+        )
+        streams.prefetch_snippets(
+            heroes, 'hero_abilities', 'ability', Ability.objects.all()
+        )
+
     api_fields = [
-        APIField('image', serializer=ImageRenditionField(
+        APIField('image', serializer=NegotiatedImageRenditionField(
             'fill-2000x2000-c80|jpegquality-100', source='high_quality_image')
         ),
         APIField('name'),
@@ -356,12 +422,22 @@ class Hero(models.Model):
         APIField('group'),
         APIField('hero_attack_types'),
         APIField('hero_roles'),
-        APIField('intelligence'),
-        APIField('agility'),
-        APIField('strength'),
-        APIField('damage'),
-        APIField('move_speed'),
-        APIField('armor'),
+        APIField('intelligence', serializer=HeroStatField('intelligence')),
+        APIField('agility', serializer=HeroStatField('agility')),
+        APIField('strength', serializer=HeroStatField('strength')),
+        APIField('damage', serializer=HeroStatField('damage')),
+        APIField('move_speed', serializer=HeroStatField('move_speed')),
+        APIField('armor', serializer=HeroStatField('armor')),
+        APIField('intelligence_base'),
+        APIField('intelligence_per_level'),
+        APIField('agility_base'),
+        APIField('agility_per_level'),
+        APIField('strength_base'),
+        APIField('strength_per_level'),
+        APIField('damage_min'),
+        APIField('damage_max'),
+        APIField('move_speed_value'),
+        APIField('armor_value'),
         APIField('biography'),
         APIField('farsi_biography'),
         APIField('hero_abilities'),
@@ -372,17 +448,38 @@ class Hero(models.Model):
     def __str__(self):
         return self.name
 
-    def save(self, *args, **kwargs):
+    def get_image_titles(self, abilities):
         hero_img_title = 'Dota 2 Hero named {}'.format(self.name)
-        wagtail_images.set_title(self.horizontal_image, hero_img_title)
-        wagtail_images.set_title(self.vertical_image, hero_img_title)
-        for ability in self.hero_abilities:
-            ability = ability.value
-            ability_img_title = "{} ability of {}".format(
-                ability.name, self.name
+        image_titles = [
+            (self.horizontal_image, hero_img_title),
+            (self.vertical_image, hero_img_title),
+        ]
+        for ability_id in streams.get_snippet_ids(self.hero_abilities, 'ability'):
+            ability = abilities.get(ability_id)
+            if ability:
+                ability_img_title = "{} ability of {}".format(
+                    ability.name, self.name
+                )
+                image_titles.append((ability.image, ability_img_title))
+        return image_titles
+
+    @staticmethod
+    def sync_image_titles(heroes):
+        ability_ids = set()
+        for hero in heroes:
+            ability_ids.update(
+                streams.get_snippet_ids(hero.hero_abilities, 'ability')
             )
-            wagtail_images.set_title(ability.image, ability_img_title)
-        super(Hero, self).save()
+        abilities = Ability.objects.select_related('image').in_bulk(ability_ids)
+        image_titles = []
+        for hero in heroes:
+            image_titles += hero.get_image_titles(abilities)
+        return wagtail_images.set_titles(image_titles)
+
+    def save(self, *args, **kwargs):
+        Hero.sync_image_titles([self])
+        self.refresh_stat_columns()
+        super(Hero, self).save(*args, **kwargs)
 
     class Meta:
         ordering = ('name',)
@@ -0,0 +1,40 @@
+from collections import OrderedDict
+
+from rest_framework.fields import Field
+from wagtail.images.api.fields import ImageRenditionField
+from wagtail.images.models import SourceImageIOError
+
+from ..modules import image_formats
+
+
+class HeroStatField(Field):
+    def __init__(self, stat, **kwargs):
+        self.stat = stat
+        kwargs['source'] = '*'
+        kwargs['read_only'] = True
+        super().__init__(**kwargs)
+
+    def to_representation(self, hero):
+        return [
+            {
+                'type': self.stat,
+                'value': hero.get_stat(self.stat),
+            }
+        ]
+
+
+class NegotiatedImageRenditionField(ImageRenditionField):
+    def to_representation(self, image):
+        try:
+            rendition = image.get_rendition(
+                image_formats.get_format_filter(self.filter_spec, self.context.get('image_format'))
+            )
+        except SourceImageIOError:
+            return OrderedDict([
+                ('error', 'SourceImageIOError'),
+            ])
+        return OrderedDict([
+            ('url', rendition.url),
+            ('width', rendition.width),
+            ('height', rendition.height),
+        ])
@@ -0,0 +1,199 @@
+import re
+from datetime import datetime, timedelta
+
+from django.conf import settings
+from django.core.cache import cache
+from django.core.paginator import EmptyPage, Page, PageNotAnInteger, Paginator
+from django.db.models import Q, prefetch_related_objects
+from django.utils import timezone
+from django.utils.functional import cached_property
+
+from ..modules import image_formats, list_processing, process_cache, wagtail_images
+
+
+CURSOR_PATTERN = re.compile(r'^([ab])(\d+)-(-?\d+)-(\d+)$')
+FRAGMENT_VERSION_KEY = 'listing-fragments'
+COUNT_VERSION_KEY = 'listing-counts'
+EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+
+def to_timestamp(value):
+    epoch = EPOCH if timezone.is_aware(value) else EPOCH.replace(tzinfo=None)
+    return (value - epoch) // timedelta(microseconds=1)
+
+
+def from_timestamp(value):
+    epoch = EPOCH if settings.USE_TZ else EPOCH.replace(tzinfo=None)
+    return epoch + timedelta(microseconds=value)
+
+
+def encode_cursor(direction, number, page):
+    return '{}{}-{}-{}'.format(
+        direction, number, to_timestamp(page.first_published_at), page.pk
+    )
+
+
+def decode_cursor(cursor):
+    match = CURSOR_PATTERN.match(cursor or '')
+    if match is None:
+        return None
+    direction, number, timestamp, pk = match.groups()
+    return direction, int(number), from_timestamp(int(timestamp)), int(pk)
+
+
+class CachedCountPaginator(Paginator):
+    def __init__(self, object_list, per_page, get_count, **kwargs):
+        super().__init__(object_list, per_page, **kwargs)
+        self.get_count = get_count
+
+    @cached_property
+    def count(self):
+        return self.get_count()
+
+
+class ListingPage(Page):
+    def __init__(self, object_list, number, paginator, has_previous, has_next):
+        super().__init__(object_list, number, paginator)
+        self._has_previous = has_previous
+        self._has_next = has_next
+        self.previous_cursor = None
+        self.next_cursor = None
+        if object_list:
+            if has_previous:
+                self.previous_cursor = encode_cursor('b', max(number - 1, 1), object_list[0])
+            if has_next:
+                self.next_cursor = encode_cursor('a', number + 1, object_list[-1])
+
+    def has_previous(self):
+        return self._has_previous
+
+    def has_next(self):
+        return self._has_next
+
+    def previous_page_number(self):
+        return max(self.number - 1, 1)
+
+    def next_page_number(self):
+        return self.number + 1
+
+
+class ListingPageMixin:
+    listing_page_size = 5
+    listing_related_fields = []
+    listing_image_field = None
+    listing_image_filter_spec = 'fill-1000x550-c100'
+    listing_rows_template = None
+
+    def get_listing_queryset(self):
+        return self.get_children().live().public().filter(
+            first_published_at__isnull=False
+        ).order_by('first_published_at', 'id')
+
+    def get_listing_count_cache_key(self):
+        return 'listing-count:{}:{}'.format(
+            self.id, process_cache.get_version(COUNT_VERSION_KEY)
+        )
+
+    def get_cached_listing_count(self):
+        return cache.get(self.get_listing_count_cache_key())
+
+    def refresh_listing_count(self):
+        count = self.get_listing_queryset().count()
+        cache.set(self.get_listing_count_cache_key(), count, None)
+        return count
+
+    def get_listing_count(self):
+        count = self.get_cached_listing_count()
+        if count is None:
+            count = self.refresh_listing_count()
+        return count
+
+    def get_listing_paginator(self):
+        return CachedCountPaginator(
+            self.get_listing_queryset(), self.listing_page_size, self.get_listing_count
+        )
+
+    def get_listing_page_by_number(self, paginator, number):
+        try:
+            posts = paginator.page(number)
+        except PageNotAnInteger:
+            posts = paginator.page(1)
+        except EmptyPage:
+            posts = paginator.page(paginator.num_pages)
+        return ListingPage(
+            list(posts.object_list.specific()), posts.number, paginator,
+            posts.has_previous(), posts.has_next(),
+        )
+
+    def get_listing_page_by_cursor(self, paginator, cursor):
+        direction, number, first_published_at, pk = cursor
+        queryset = self.get_listing_queryset()
+        size = self.listing_page_size
+        if direction == 'a':
+            items = list(queryset.filter(
+                Q(first_published_at__gt=first_published_at) |
+                Q(first_published_at=first_published_at, id__gt=pk)
+            ).specific()[:size + 1])
+            has_previous, has_next = True, len(items) > size
+            items = items[:size]
+        else:
+            items = list(queryset.filter(
+                Q(first_published_at__lt=first_published_at) |
+                Q(first_published_at=first_published_at, id__lt=pk)
+            ).order_by('-first_published_at', '-id').specific()[:size + 1])
+            has_previous, has_next = len(items) > size, True
+            items = list(reversed(items[:size]))
+        if not items:
+            return self.get_listing_page_by_number(paginator, 1)
+        if not has_previous:
+            number = 1
+        return ListingPage(items, number, paginator, has_previous, has_next)
+
+    def get_listing_page(self, request):
+        paginator = self.get_listing_paginator()
+        cursor = decode_cursor(request.GET.get('cursor'))
+        if cursor:
+            posts = self.get_listing_page_by_cursor(paginator, cursor)
+        else:
+            posts = self.get_listing_page_by_number(paginator, request.GET.get('page'))
+        self.prepare_listing_items(posts.object_list, request)
+        return posts
+
+    def prepare_listing_items(self, items, request):
+        if self.listing_related_fields:
+            prefetch_related_objects(items, *self.listing_related_fields)
+        if self.listing_image_field:
+            wagtail_images.preload_renditions(
+                [getattr(item, self.listing_image_field) for item in items],
+                image_formats.negotiate(self.listing_image_filter_spec, request)
+            )
+
+    @staticmethod
+    def get_row_posts(posts):
+        return list(
+            reversed(list_processing.list_to_sublists_of_size_n(posts, 2))
+        )
+
+    def get_listing_title(self, item):
+        return item.title
+
+    def get_listing_card(self, item, request):
+        image = None
+        if self.listing_image_field:
+            image = wagtail_images.get_rendition(
+                getattr(item, self.listing_image_field),
+                image_formats.negotiate(self.listing_image_filter_spec, request)
+            )
+        return {
+            'id': item.id,
+            'title': self.get_listing_title(item),
+            'image': image.url if image else None,
+            'url': item.get_url(request),
+        }
+
+    def get_context(self, request, *args, **kwargs):
+        context = super().get_context(request, *args, **kwargs)
+        posts = self.get_listing_page(request)
+        context['row_posts'] = self.get_row_posts(posts)
+        context['posts'] = posts
+        return context
@@ -0,0 +1,60 @@
+from django.core.cache import cache
+from django.http import Http404, JsonResponse
+from django.shortcuts import get_object_or_404
+from django.template.loader import render_to_string
+from django.utils import translation
+from django.utils.cache import patch_cache_control, patch_vary_headers
+from wagtail.core.models import Page
+
+from ..modules import image_formats, process_cache
+from .models import FRAGMENT_VERSION_KEY, ListingPageMixin
+
+
+FRAGMENT_FORMATS = ('json', 'html')
+FRAGMENT_TIMEOUT = 60 * 60
+
+
+def get_fragment_cache_key(page_id, request, fragment_format):
+    return 'listing-fragment:{}:{}:{}:{}:{}:{}:{}'.format(
+        page_id, translation.get_language(), fragment_format,
+        image_formats.get_image_format(request),
+        request.GET.get('cursor', ''), request.GET.get('page', ''),
+        process_cache.get_version(FRAGMENT_VERSION_KEY),
+    )
+
+
+def get_fragment(page, request, fragment_format):
+    posts = page.get_listing_page(request)
+    fragment = {
+        'number': posts.number,
+        'previous_cursor': posts.previous_cursor,
+        'next_cursor': posts.next_cursor,
+    }
+    if fragment_format == 'html':
+        fragment['html'] = render_to_string(page.listing_rows_template, {
+            'page': page,
+            'row_posts': page.get_row_posts(posts),
+            'posts': posts,
+        }, request=request)
+    else:
+        fragment['cards'] = [page.get_listing_card(item, request) for item in posts]
+    return fragment
+
+
+def fragment(request, page_id):
+    fragment_format = request.GET.get('format', 'json')
+    if fragment_format not in FRAGMENT_FORMATS:
+        raise Http404
+    cache_key = get_fragment_cache_key(page_id, request, fragment_format)
+    data = cache.get(cache_key)
+    if data is None:
+        page = get_object_or_404(Page.objects.live().public(), id=page_id).specific
+        if not isinstance(page, ListingPageMixin):
+            raise Http404
+        data = get_fragment(page, request, fragment_format)
+        cache.set(cache_key, data, FRAGMENT_TIMEOUT)
+    response = JsonResponse(data)
+    patch_cache_control(response, public=True, max_age=60)
+    # publicly cached, and the card images are negotiated from the accept header
+    patch_vary_headers(response, ('Accept',))
+    return response
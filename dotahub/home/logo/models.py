@@ -1,8 +1,10 @@
-from django.db import models
+from django.db import models, transaction
 from wagtail.admin.edit_handlers import FieldPanel, MultiFieldPanel
 from wagtail.images.edit_handlers import ImageChooserPanel
 from wagtail.snippets.models import register_snippet
 
+from ..modules import process_cache
+
 
 class LogoContainingPageMixin:
 
@@ -28,7 +30,7 @@ class LogoContainingPageMixin:
 
     @property
     def logo(self):
-        return Logo.objects.filter(enabled=True).first()
+        return Logo.get_active()
 
 
 @register_snippet
@@ -79,10 +81,19 @@ class Logo(models.Model):
     def __str__(self):
         return 'Logo-{}'.format(self.pk)
 
+    @classmethod
+    def load_active(cls):
+        return cls.objects.filter(enabled=True).select_related(
+            'logo_image_light', 'logo_image_dark',
+            'text_image_light', 'text_image_dark',
+        ).first()
+
+    @classmethod
+    def get_active(cls):
+        return process_cache.get('active-logo', cls.load_active)
+
     def save(self, *args, **kwargs):
-        super().save(*args, **kwargs)
-        if self.enabled:
-            other_logos = Logo.objects.all().exclude(pk=self.pk)
-            for logo in other_logos:
-                logo.enabled = False
-                logo.save()
+        with transaction.atomic():
+            super().save(*args, **kwargs)
+            if self.enabled:
+                Logo.objects.filter(enabled=True).exclude(pk=self.pk).update(enabled=False)
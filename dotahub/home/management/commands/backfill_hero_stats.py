@@ -0,0 +1,16 @@
+from django.core.management.base import BaseCommand
+
+from home.heroes.models import Hero
+
+
+class Command(BaseCommand):
+    help = 'Copies hero stats from their stream fields into the numeric stat columns.'
+
+    def handle(self, *args, **options):
+        heroes = list(Hero.objects.all())
+        for hero in heroes:
+            hero.refresh_stat_columns()
+        Hero.objects.bulk_update(
+            heroes, Hero.get_stat_column_names(), batch_size=100
+        )
+        self.stdout.write('Updated the stat columns of {} heroes.'.format(len(heroes)))
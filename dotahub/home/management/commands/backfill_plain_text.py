@@ -0,0 +1,19 @@
+from django.core.management.base import BaseCommand
+
+from home.models import BlogPost, ShortPostPage, ShortVideoPage
+
+
+class Command(BaseCommand):
+    help = 'Fills the plain text columns of short videos, short posts and blog posts from their rich text.'
+
+    def handle(self, *args, **options):
+        for model in (ShortVideoPage, ShortPostPage, BlogPost):
+            instances = list(model.objects.all())
+            for instance in instances:
+                instance.refresh_plain_text_columns()
+            model.objects.bulk_update(
+                instances, model.get_plain_text_column_names(), batch_size=100
+            )
+            self.stdout.write('Updated the plain text columns of {} {} objects.'.format(
+                len(instances), model.__name__
+            ))
@@ -0,0 +1,14 @@
+from django.core.management.base import BaseCommand
+
+from home.models import BlogPost
+
+
+class Command(BaseCommand):
+    help = 'Fills the section outline of blog posts from their sections.'
+
+    def handle(self, *args, **options):
+        blog_posts = list(BlogPost.objects.all())
+        for blog_post in blog_posts:
+            blog_post.refresh_section_outline()
+        BlogPost.objects.bulk_update(blog_posts, ['section_outline'], batch_size=100)
+        self.stdout.write('Updated the section outline of {} blog posts.'.format(len(blog_posts)))
@@ -0,0 +1,79 @@
+import timeit
+
+from bs4 import BeautifulSoup
+from django.core.management.base import BaseCommand, CommandError
+
+from home.models import AllDotaBlogPost1, ShortPostPage, ShortVideoPage
+from home.modules import text_processing
+
+
+def soup_html_to_str(html, break_line=False):
+    soup = BeautifulSoup(html, 'html.parser')
+    result = ''
+    for paragraph in soup.find_all('p'):
+        result += (paragraph.get_text().strip() + '\n')
+    if not break_line:
+        result = result.replace('\n', ' ')
+    return result.strip()
+
+
+def get_blog_post_samples(blog_post):
+    samples = [
+        blog_post.post_title, blog_post.post_summary,
+        blog_post.post_introduction, blog_post.post_conclusion,
+    ]
+    for section in blog_post.sections:
+        samples.append(section.value['title'].source)
+    return samples
+
+
+def get_samples():
+    samples = {'en': [], 'fa': []}
+    for page in ShortVideoPage.objects.all():
+        samples['en'] += [page.english_title, page.english_caption]
+        samples['fa'] += [page.farsi_title, page.farsi_caption]
+    for page in ShortPostPage.objects.all():
+        samples['en'].append(page.english_caption)
+        samples['fa'].append(page.farsi_caption)
+    for page in AllDotaBlogPost1.objects.select_related('english_content', 'farsi_content'):
+        if page.english_content:
+            samples['en'] += get_blog_post_samples(page.english_content)
+        if page.farsi_content:
+            samples['fa'] += get_blog_post_samples(page.farsi_content)
+    return {
+        language: [sample for sample in language_samples if sample]
+        for language, language_samples in samples.items()
+    }
+
+
+class Command(BaseCommand):
+    help = 'Compares the BeautifulSoup and streaming html_to_str implementations on stored rich text.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--repeat', type=int, default=20)
+
+    def time(self, function, samples, repeat):
+        return timeit.timeit(
+            lambda: [function(sample) for sample in samples], number=repeat
+        ) / (repeat * len(samples)) * 1000000
+
+    def handle(self, *args, **options):
+        repeat = options['repeat']
+        for language, samples in get_samples().items():
+            if not samples:
+                self.stdout.write('{}: no samples.'.format(language))
+                continue
+            for sample in samples:
+                for break_line in (False, True):
+                    if soup_html_to_str(sample, break_line) != text_processing.html_to_str(sample, break_line):
+                        raise CommandError('Outputs differ for {!r}'.format(sample[:200]))
+            soup = self.time(soup_html_to_str, samples, repeat)
+            streaming = self.time(text_processing.extract_paragraphs, samples, repeat)
+            cached = self.time(text_processing.html_to_str, samples, repeat)
+            self.stdout.write(
+                '{}: {} samples, BeautifulSoup {:.1f}us, streaming {:.1f}us ({:.1f}x), '
+                'cached {:.1f}us ({:.1f}x) per call.'.format(
+                    language, len(samples), soup,
+                    streaming, soup / streaming, cached, soup / cached,
+                )
+            )
@@ -0,0 +1,80 @@
+import random
+import statistics
+import time
+from concurrent.futures import ThreadPoolExecutor
+from urllib.request import Request, urlopen
+
+from django.core.management.base import BaseCommand, CommandError
+from django.urls import reverse
+from wagtailmedia.models import get_media_model
+
+
+def fetch_range(url, start, end):
+    request = Request(url, headers={'Range': 'bytes={}-{}'.format(start, end)})
+    began = time.perf_counter()
+    with urlopen(request) as response:
+        body = response.read()
+        content_range = response.headers.get('Content-Range')
+        status = response.status
+    elapsed = time.perf_counter() - began
+    ok = status == 206 and len(body) == end - start + 1 and content_range.startswith(
+        'bytes {}-{}/'.format(start, end)
+    )
+    return elapsed, len(body), ok
+
+
+class Command(BaseCommand):
+    help = 'Measures range request throughput of the media view with concurrent clients seeking at random.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--base-url', default='http://127.0.0.1:8000')
+        parser.add_argument('--media', type=int, help='media id, defaults to the largest video')
+        parser.add_argument('--clients', type=int, default=8)
+        parser.add_argument('--requests', type=int, default=50, help='requests per client')
+        parser.add_argument('--range-size', type=int, default=1024 * 1024)
+
+    def handle(self, *args, **options):
+        media_model = get_media_model()
+        if options['media']:
+            media = media_model.objects.get(pk=options['media'])
+        else:
+            media = max(
+                media_model.objects.filter(type='video'),
+                key=lambda media: media.file.size, default=None
+            )
+        if media is None:
+            raise CommandError('No video to benchmark.')
+        size = media.file.size
+        url = options['base_url'].rstrip('/') + reverse('serve_media', args=[media.id])
+        range_size = min(options['range_size'], size)
+
+        def seek(start_offsets):
+            return [
+                fetch_range(url, start, start + range_size - 1)
+                for start in start_offsets
+            ]
+
+        offsets = [
+            [random.randrange(0, size - range_size + 1) for i in range(options['requests'])]
+            for client in range(options['clients'])
+        ]
+        began = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=options['clients']) as executor:
+            results = [
+                result for client_results in executor.map(seek, offsets)
+                for result in client_results
+            ]
+        elapsed = time.perf_counter() - began
+
+        latencies = sorted(result[0] for result in results)
+        transferred = sum(result[1] for result in results)
+        failed = sum(1 for result in results if not result[2])
+        self.stdout.write(
+            '{} ranges of {} bytes from a {} byte file by {} clients in {:.2f}s: '
+            '{:.1f} requests/s, {:.1f} MB/s, median {:.1f}ms, p95 {:.1f}ms, {} invalid responses.'.format(
+                len(results), range_size, size, options['clients'], elapsed,
+                len(results) / elapsed, transferred / elapsed / 1024 / 1024,
+                statistics.median(latencies) * 1000,
+                latencies[int(len(latencies) * 0.95) - 1] * 1000, failed,
+            )
+        )
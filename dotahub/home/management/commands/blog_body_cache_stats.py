@@ -0,0 +1,20 @@
+from django.core.management.base import BaseCommand
+
+from home.blogs import rendering
+
+
+class Command(BaseCommand):
+    help = 'Reports the hit and miss counters of the rendered blog body cache.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--reset', action='store_true')
+
+    def handle(self, *args, **options):
+        stats = rendering.get_stats()
+        total = stats['hits'] + stats['misses']
+        self.stdout.write('{} hits, {} misses, {:.1%} hit rate.'.format(
+            stats['hits'], stats['misses'], stats['hits'] / total if total else 0
+        ))
+        if options['reset']:
+            rendering.reset_stats()
+            self.stdout.write('Counters reset.')
@@ -0,0 +1,68 @@
+from unittest import mock
+
+from django.contrib.auth.models import AnonymousUser
+from django.core.management.base import BaseCommand, CommandError
+from django.test import RequestFactory
+from django.utils import translation
+from wagtail.core.models import Site
+
+from home.models import HeroPage
+from home.modules import text_processing
+from home.multilingual.models import MultilingualPageMixin
+
+
+def counted_property(prop, counter, name):
+    def getter(self):
+        counter[name] += 1
+        return prop.fget(self)
+    return property(getter)
+
+
+class Command(BaseCommand):
+    help = 'Renders a hero page and counts how many template language and name lookups are memoized.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--page', type=int, help='id of the hero page, defaults to the first live one')
+
+    def render(self, page, language):
+        with translation.override(language):
+            request = RequestFactory().get(page.get_url())
+            request.user = AnonymousUser()
+            request.site = Site.find_for_request(request)
+            page.serve(request).render()
+
+    def handle(self, *args, **options):
+        pages = HeroPage.objects.live()
+        if options['page']:
+            pages = pages.filter(pk=options['page'])
+        page = pages.first()
+        if page is None:
+            raise CommandError('No live hero page found.')
+
+        for language in ('en', 'fa'):
+            page = HeroPage.objects.get(pk=page.pk)
+            counter = {'template_language': 0, 'template_file': 0}
+            with mock.patch.object(
+                MultilingualPageMixin, 'template_language',
+                counted_property(MultilingualPageMixin.template_language, counter, 'template_language')
+            ), mock.patch.object(
+                MultilingualPageMixin, 'template_file',
+                counted_property(MultilingualPageMixin.template_file, counter, 'template_file')
+            ), mock.patch.object(
+                MultilingualPageMixin, 'get_template_language', autospec=True,
+                side_effect=MultilingualPageMixin.get_template_language
+            ) as get_template_language, mock.patch.object(
+                text_processing, 'upper_camel_to_snake',
+                wraps=text_processing.upper_camel_to_snake
+            ) as upper_camel_to_snake:
+                self.render(page, language)
+            self.stdout.write(
+                '{}: template_language read {} times, resolved {} times, {} avoided; '
+                'template_file read {} times, regex ran {} times, {} avoided.'.format(
+                    language,
+                    counter['template_language'], get_template_language.call_count,
+                    counter['template_language'] - get_template_language.call_count,
+                    counter['template_file'], upper_camel_to_snake.call_count,
+                    counter['template_file'] - upper_camel_to_snake.call_count,
+                )
+            )
@@ -0,0 +1,157 @@
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import django
+from django.core.management.base import BaseCommand
+from django.db import connections
+from wagtail.images import get_image_model
+from wagtail.images.models import Filter, SourceImageIOError
+
+from home.models import (
+    Ability, AllDotaBlogPost1, BlogPost, Dota2IntroductionPage, Hero,
+    HeroPropertyImage, Language, Logo, ShortPostPage, ShortVideoPage, VideoProbe,
+)
+from home.modules import image_formats
+
+FIELD_FILTER_SPECS = [
+    (Hero, 'horizontal_image', ['fill-5000x3000']),
+    (Hero, 'vertical_image', ['fill-3000x4000']),
+    (Hero, 'high_quality_image', ['fill-2000x2000-c80|jpegquality-100']),
+    (Ability, 'image', ['width-90|height-90']),
+    (HeroPropertyImage, 'intelligence', ['width-33|height-33']),
+    (HeroPropertyImage, 'agility', ['width-33|height-33']),
+    (HeroPropertyImage, 'strength', ['width-33|height-33']),
+    (HeroPropertyImage, 'damage', ['width-33|height-33']),
+    (HeroPropertyImage, 'move_speed', ['width-55|height-55']),
+    (HeroPropertyImage, 'armor', ['width-55|height-55']),
+    (Logo, 'logo_image_light', ['original']),
+    (Logo, 'logo_image_dark', ['original', 'width-16|height-16']),
+    (Logo, 'text_image_light', ['original']),
+    (Logo, 'text_image_dark', ['original']),
+    (Language, 'flag', ['fill-4000x2500']),
+    (ShortVideoPage, 'video_thumbnail', ['fill-1000x550-c100']),
+    (VideoProbe, 'thumbnail', ['fill-1000x550-c100']),
+    (ShortPostPage, 'image', ['fill-1000x600-c100', 'original']),
+    (AllDotaBlogPost1, 'image', ['fill-1000x550-c100', 'fill-4000x2000']),
+]
+
+SECTION_IMAGE_FILTER_SPECS = {
+    'image_and_text_row': ['fill-1000x1000'],
+    'image': ['original'],
+}
+
+INTRODUCTION_BACKGROUND_FILTER_SPECS = ['fill-3000x2000']
+
+
+def get_raw_stream(stream):
+    if stream.is_lazy:
+        return stream.stream_data
+    return stream.stream_block.get_prep_value(stream)
+
+
+def get_image_filter_specs():
+    for model, field_name, filter_specs in FIELD_FILTER_SPECS:
+        image_ids = model.objects.exclude(
+            **{field_name: None}
+        ).values_list(field_name, flat=True)
+        for image_id in image_ids:
+            for filter_spec in filter_specs:
+                yield image_id, filter_spec
+    for page in Dota2IntroductionPage.objects.all():
+        for section in get_raw_stream(page.sections):
+            image_id = section['value'].get('background')
+            if image_id:
+                for filter_spec in INTRODUCTION_BACKGROUND_FILTER_SPECS:
+                    yield image_id, filter_spec
+    for blog_post in BlogPost.objects.all():
+        for section in get_raw_stream(blog_post.sections):
+            for item in section['value'].get('content', []):
+                filter_specs = SECTION_IMAGE_FILTER_SPECS.get(item['type'], [])
+                image_id = item['value'].get('image') if filter_specs else None
+                if image_id:
+                    for filter_spec in filter_specs:
+                        yield image_id, filter_spec
+
+
+def init_worker():
+    django.setup()
+    connections.close_all()
+
+
+def generate_rendition(image_id, filter_spec):
+    start = time.time()
+    try:
+        image = get_image_model().objects.get(pk=image_id)
+        image.get_rendition(filter_spec)
+        error = None
+    except (get_image_model().DoesNotExist, SourceImageIOError) as e:
+        error = str(e) or type(e).__name__
+    return image_id, filter_spec, time.time() - start, error
+
+
+class Command(BaseCommand):
+    help = 'Generates the missing renditions used by templates and the API.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--workers', type=int, default=os.cpu_count())
+        parser.add_argument('--dry-run', action='store_true')
+        parser.add_argument('--no-webp', action='store_true', help='skip the webp variants')
+
+    def handle(self, *args, **options):
+        formats = [None] if options['no_webp'] else [None, image_formats.WEBP]
+        jobs = {
+            (image_id, image_formats.get_filter_spec(filter_spec, image_format))
+            for image_id, filter_spec in get_image_filter_specs()
+            for image_format in formats
+        }
+        images = get_image_model().objects.in_bulk(
+            {image_id for image_id, filter_spec in jobs}
+        )
+        Rendition = get_image_model().get_rendition_model()
+        existing = set(
+            Rendition.objects.filter(
+                image_id__in=images.keys()
+            ).values_list('image_id', 'filter_spec', 'focal_point_key')
+        )
+        filters = {}
+        missing = []
+        for image_id, filter_spec in sorted(jobs):
+            image = images.get(image_id)
+            if image is not None:
+                # renditions are keyed by the focal point too, older ones are regenerated on request
+                image_filter = filters.setdefault(filter_spec, Filter(spec=filter_spec))
+                if (image_id, filter_spec, image_filter.get_cache_key(image)) in existing:
+                    continue
+            missing.append((image_id, filter_spec))
+        self.stdout.write(
+            '{} renditions in use, {} missing.'.format(len(jobs), len(missing))
+        )
+        if options['dry_run'] or not missing:
+            return
+
+        # Each worker process opens its own database connection.
+        connections.close_all()
+        start = time.time()
+        failed = 0
+        with ProcessPoolExecutor(
+            max_workers=options['workers'], initializer=init_worker
+        ) as executor:
+            futures = [
+                executor.submit(generate_rendition, image_id, filter_spec)
+                for image_id, filter_spec in missing
+            ]
+            for done, future in enumerate(as_completed(futures), 1):
+                image_id, filter_spec, seconds, error = future.result()
+                if error:
+                    failed += 1
+                    self.stderr.write('[{}/{}] image {} {}: {}'.format(
+                        done, len(missing), image_id, filter_spec, error
+                    ))
+                else:
+                    self.stdout.write('[{}/{}] image {} {} in {:.2f}s'.format(
+                        done, len(missing), image_id, filter_spec, seconds
+                    ))
+        self.stdout.write('Generated {} renditions in {:.2f}s, {} failed.'.format(
+            len(missing) - failed, time.time() - start, failed
+        ))
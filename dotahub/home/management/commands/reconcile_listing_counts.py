@@ -0,0 +1,22 @@
+from django.core.management.base import BaseCommand
+from wagtail.core.models import get_page_models
+
+from home.listing.models import ListingPageMixin
+
+
+class Command(BaseCommand):
+    help = 'Recounts the live, public children of every listing page and repairs cached counts that drifted. Meant to run periodically.'
+
+    def handle(self, *args, **options):
+        repaired = 0
+        pages = [
+            page for model in get_page_models() if issubclass(model, ListingPageMixin)
+            for page in model.objects.all()
+        ]
+        for page in pages:
+            cached = page.get_cached_listing_count()
+            count = page.refresh_listing_count()
+            if cached is not None and cached != count:
+                repaired += 1
+                self.stdout.write('{}: cached {}, actual {}.'.format(page, cached, count))
+        self.stdout.write('Repaired {} listing counts.'.format(repaired))
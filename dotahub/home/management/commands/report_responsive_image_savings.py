@@ -0,0 +1,89 @@
+import re
+from collections import OrderedDict
+
+from django.core.management.base import BaseCommand
+from django.db.models import Q
+from wagtail.images import get_image_model
+
+from home.models import AllDotaBlogPost1, BlogPost, Dota2IntroductionPage
+from home.modules import wagtail_images
+
+SIZE_PATTERN = re.compile(r'^(?:\(min-width:\s*(\d+)px\)\s+)?(\d+)(vw|px)$')
+SECTION_IMAGE_SETS = {
+    'image': 'section-image',
+    'image_and_text_row': 'section-image-row',
+}
+
+
+def get_slot_width(sizes, viewport_width):
+    for size in sizes.split(','):
+        min_width, length, unit = SIZE_PATTERN.match(size.strip()).groups()
+        if min_width is None or viewport_width >= int(min_width):
+            return int(length) * viewport_width / 100 if unit == 'vw' else int(length)
+    return viewport_width
+
+
+def choose_rendition(renditions, width):
+    for rendition in renditions:
+        if rendition.width >= width:
+            return rendition
+    return renditions[-1]
+
+
+def get_blog_section_images():
+    images = []
+    for blog_post in BlogPost.objects.filter(
+        Q(english_content__live=True) | Q(farsi_content__live=True)
+    ).distinct():
+        for section in blog_post.sections.get_prep_value():
+            for child in section['value'].get('content') or []:
+                if child['type'] in SECTION_IMAGE_SETS:
+                    images.append((child['value'].get('image'), SECTION_IMAGE_SETS[child['type']]))
+    return images
+
+
+def get_introduction_images():
+    return [
+        (section['value'].get('background'), 'introduction-background')
+        for page in Dota2IntroductionPage.objects.live()
+        for section in page.sections.get_prep_value()
+    ]
+
+
+class Command(BaseCommand):
+    help = 'Compares the bytes of the single renditions blog and introduction images used to ship ' \
+           'with what their responsive rendition sets deliver to a given viewport.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--viewport-width', type=int, default=412)
+        parser.add_argument('--pixel-ratio', type=float, default=2.625)
+
+    def handle(self, *args, **options):
+        usages = OrderedDict([
+            ('AllDotaBlogPost1', [
+                (page.image_id, 'post-image') for page in AllDotaBlogPost1.objects.live()
+            ] + get_blog_section_images()),
+            ('Dota2IntroductionPage', get_introduction_images()),
+        ])
+        images = get_image_model().objects.in_bulk(
+            [image_id for image_usages in usages.values() for image_id, name in image_usages if image_id]
+        )
+        for page_type, image_usages in usages.items():
+            image_usages = [(images[image_id], name) for image_id, name in image_usages if image_id in images]
+            single_specs = {}
+            for image, name in image_usages:
+                single_specs.setdefault(image, set()).add(wagtail_images.RENDITION_SETS[name][0])
+            rendition_sets = wagtail_images.get_rendition_sets(single_specs)
+            single_bytes = responsive_bytes = 0
+            for image, name in image_usages:
+                filter_spec, sizes = wagtail_images.RENDITION_SETS[name]
+                rendition = choose_rendition(
+                    wagtail_images.get_rendition_set(image, name),
+                    get_slot_width(sizes, options['viewport_width']) * options['pixel_ratio']
+                )
+                single_bytes += rendition_sets[image.pk][filter_spec].file.size
+                responsive_bytes += rendition.file.size
+            self.stdout.write('{}: {} images, {:.1f}KB as single renditions, {:.1f}KB responsive, {:.1%} saved.'.format(
+                page_type, len(image_usages), single_bytes / 1024, responsive_bytes / 1024,
+                1 - responsive_bytes / single_bytes if single_bytes else 0,
+            ))
@@ -0,0 +1,69 @@
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import django
+from django.core.management.base import BaseCommand
+from django.db import connections
+
+from home.models import ShortVideoPage, ThumbnailJob
+
+
+def init_worker():
+    django.setup()
+    connections.close_all()
+
+
+def work(once, poll_interval):
+    done = failed = 0
+    while True:
+        job = ThumbnailJob.claim()
+        if job is None:
+            if once:
+                return done, failed
+            time.sleep(poll_interval)
+            continue
+        job.run()
+        if job.status == ThumbnailJob.DONE:
+            done += 1
+        else:
+            failed += 1
+
+
+class Command(BaseCommand):
+    help = 'Probes short videos queued at publish time for metadata, poster thumbnail and sprite sheet, using a pool of worker processes.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--workers', type=int, default=2)
+        parser.add_argument('--poll-interval', type=float, default=5)
+        parser.add_argument(
+            '--once', action='store_true', help='exit when the queue is empty'
+        )
+        parser.add_argument(
+            '--enqueue-missing', action='store_true',
+            help='queue every live short video whose media file has not been probed yet'
+        )
+
+    def handle(self, *args, **options):
+        requeued = ThumbnailJob.requeue_stale()
+        if requeued:
+            self.stdout.write('Requeued {} stale jobs.'.format(requeued))
+        if options['enqueue_missing']:
+            for page in ShortVideoPage.objects.live().filter(
+                video__isnull=False
+            ).select_related('video__probe'):
+                if page.needs_probing:
+                    ThumbnailJob.enqueue(page)
+        connections.close_all()
+        with ProcessPoolExecutor(
+            max_workers=options['workers'], initializer=init_worker
+        ) as executor:
+            futures = [
+                executor.submit(work, options['once'], options['poll_interval'])
+                for i in range(options['workers'])
+            ]
+            done = failed = 0
+            for future in futures:
+                worker_done, worker_failed = future.result()
+                done += worker_done
+                failed += worker_failed
+        self.stdout.write('Probed {} videos, {} attempts failed.'.format(done, failed))
@@ -0,0 +1,28 @@
+from django.core.management.base import BaseCommand
+
+from home.heroes.models import Hero
+
+
+class Command(BaseCommand):
+    help = 'Updates the titles of hero and ability images that are out of date.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--chunk-size', type=int, default=50)
+
+    def handle(self, *args, **options):
+        heroes = Hero.objects.select_related(
+            'horizontal_image', 'vertical_image'
+        ).order_by('pk')
+        last_pk = 0
+        hero_count = 0
+        image_count = 0
+        while True:
+            chunk = list(heroes.filter(pk__gt=last_pk)[:options['chunk_size']])
+            if not chunk:
+                break
+            image_count += Hero.sync_image_titles(chunk)
+            hero_count += len(chunk)
+            last_pk = chunk[-1].pk
+        self.stdout.write(
+            'Checked {} heroes, renamed {} images.'.format(hero_count, image_count)
+        )
@@ -0,0 +1,15 @@
+from django.utils.cache import patch_vary_headers
+
+# pages and listing fragments embed rendition urls negotiated from the accept header
+VARIED_CONTENT_TYPES = ('text/html', 'application/json')
+
+
+class VaryOnAcceptMiddleware:
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        response = self.get_response(request)
+        if response.get('Content-Type', '').startswith(VARIED_CONTENT_TYPES):
+            patch_vary_headers(response, ('Accept',))
+        return response
@@ -1,9 +1,6 @@
-import os
 import uuid
 
-import cv2
-from django.core.files import File
-from django.core.paginator import Paginator, PageNotAnInteger, EmptyPage
+from django.utils.cache import patch_vary_headers
 from django.utils.text import slugify
 from modelcluster.contrib.taggit import ClusterTaggableManager
 from modelcluster.fields import ParentalKey
@@ -14,14 +11,20 @@ from wagtail.images.models import Image
 from wagtailmedia.edit_handlers import MediaChooserPanel
 from wagtailmetadata.models import MetadataPageMixin
 
+from .blogs import rendering
 from .blogs.models import BlogPost
-from .modules import list_processing
+from .modules import process_cache
+from .heroes import facets
 from .heroes.blocks import *
 from .heroes.models import *
 from .blogs.blocks import *
 from .introduction.blocks import *
 from .logo.models import *
 from .multilingual.models import *
+from .listing.models import FRAGMENT_VERSION_KEY, ListingPageMixin
+from .plain_text.models import PlainTextColumnsMixin
+from .videos import probing
+from .videos.models import ThumbnailJob, VideoProbe
 
 
 class AllDotaPageMixin:
@@ -30,6 +33,12 @@ class AllDotaPageMixin:
     def get_home_page():
         return HomePage.objects.first()
 
+    def serve(self, request, *args, **kwargs):
+        response = super().serve(request, *args, **kwargs)
+        # image tags pick rendition urls from the accept header
+        patch_vary_headers(response, ('Accept',))
+        return response
+
 
 class HomePage(AllDotaPageMixin, LogoContainingPageMixin, Page):
     subpage_types = [
@@ -46,47 +55,66 @@ class HeroesPage(
     MetadataPageMixin, HeroesPageMixin, MultilingualPageMixin, Page
 ):
 
+    @staticmethod
+    def build_hero_roster():
+        roster = {}
+        hero_pages = HeroPage.objects.live().select_related(
+            'hero', 'hero__hero_type', 'hero__horizontal_image'
+        )
+        for hero_page in hero_pages:
+            hero = hero_page.hero
+            if hero and hero.hero_type:
+                roster.setdefault(
+                    (hero.hero_type.name, hero.ego), []
+                ).append(hero_page)
+        return roster
+
+    @property
+    def hero_roster(self):
+        return process_cache.get('hero-roster', self.build_hero_roster)
+
+    @property
+    def hero_images(self):
+        return [
+            hero_page.hero.horizontal_image
+            for hero_pages in self.hero_roster.values()
+            for hero_page in hero_pages
+        ]
+
+    selected_hero_ids = None
+
+    def get_roster_heroes(self, hero_type, ego):
+        hero_pages = self.hero_roster.get((hero_type, ego), [])
+        if self.selected_hero_ids is None:
+            return hero_pages
+        return [
+            hero_page for hero_page in hero_pages
+            if hero_page.hero_id in self.selected_hero_ids
+        ]
+
     @property
     def radiant_strength_heroes(self):
-        return HeroPage.objects.live().filter(
-            hero__hero_type__name='Strength',
-            hero__ego='Radiant'
-        )
+        return self.get_roster_heroes('Strength', 'Radiant')
 
     @property
     def dire_strength_heroes(self):
-        return HeroPage.objects.live().filter(
-            hero__hero_type__name='Strength',
-            hero__ego='Dire'
-        )
+        return self.get_roster_heroes('Strength', 'Dire')
 
     @property
     def radiant_agility_heroes(self):
-        return HeroPage.objects.live().filter(
-            hero__hero_type__name='Agility',
-            hero__ego='Radiant'
-        )
+        return self.get_roster_heroes('Agility', 'Radiant')
 
     @property
     def dire_agility_heroes(self):
-        return HeroPage.objects.live().filter(
-            hero__hero_type__name='Agility',
-            hero__ego='Dire'
-        )
+        return self.get_roster_heroes('Agility', 'Dire')
 
     @property
     def radiant_intelligence_heroes(self):
-        return HeroPage.objects.live().filter(
-            hero__hero_type__name='Intelligence',
-            hero__ego='Radiant'
-        )
+        return self.get_roster_heroes('Intelligence', 'Radiant')
 
     @property
     def dire_intelligence_heroes(self):
-        return HeroPage.objects.live().filter(
-            hero__hero_type__name='Intelligence',
-            hero__ego='Dire'
-        )
+        return self.get_roster_heroes('Intelligence', 'Dire')
 
     content_panels = []
     promote_panels = []
@@ -110,6 +138,17 @@ class HeroesPage(
             self.seo_title = 'All Dota2 Heroes'
         return super().serve(request, *args, **kwargs)
 
+    def get_context(self, request, *args, **kwargs):
+        context = super().get_context(request, *args, **kwargs)
+        facet_index = facets.get_facet_index()
+        selection = facets.get_selection(request.GET)
+        if selection:
+            self.selected_hero_ids = set(
+                facet_index.get_hero_ids(facet_index.filter(selection))
+            )
+        context['hero_facets'] = facet_index.get_links(selection)
+        return context
+
     @property
     def template(self):
         return super().template
@@ -259,7 +298,7 @@ class ShortVideoPageFarsiTag(TaggedItemBase):
 
 class ShortVideoPage(
     AllDotaPageMixin, LogoContainingPageMixin,
-    MetadataPageMixin, MultilingualPageMixin, Page
+    MetadataPageMixin, MultilingualPageMixin, PlainTextColumnsMixin, Page
 ):
     video = models.ForeignKey(
         'wagtailmedia.Media',
@@ -274,36 +313,33 @@ class ShortVideoPage(
         null=True, blank=True, on_delete=models.SET_NULL, related_name='+'
     )
 
+    sprite_columns = probing.SPRITE_COLUMNS
+
+    @property
+    def video_probe(self):
+        try:
+            return self.video.probe if self.video_id else None
+        except VideoProbe.DoesNotExist:
+            return None
+
     @property
     def thumbnail(self):
-        if self.video_thumbnail:
-            return self.video_thumbnail
-        else:
-            return self.update_thumbnail()
+        # generated by the thumbnail worker after publishing, templates show a placeholder until then
+        probe = self.video_probe
+        if probe is not None and probe.thumbnail_id:
+            return probe.thumbnail
+        return self.video_thumbnail
 
-    def update_thumbnail(self):
-        generated_file = False
-        if self.video.thumbnail:
-            file = open(self.video.thumbnail.path, 'rb')
-            file = File(file)
-        else:
-            clip = cv2.VideoCapture(self.video.file.path)
-            ret, frame = clip.read()
-            generated_file = 'thumbnail.jpeg'
-            cv2.imwrite(generated_file, frame)
-            file = open(generated_file, 'rb')
-            file = File(file)
-        thumbnail = Image(
-            title=text_processing.html_to_str(
-                self.english_title
-            ), file=file
-        )
-        thumbnail.save()
-        self.video_thumbnail = thumbnail
-        self.save()
-        if generated_file:
-            os.remove(generated_file)
-        return thumbnail
+    @property
+    def needs_probing(self):
+        if not self.video_id:
+            return False
+        probe = self.video_probe
+        return probe is None or not probe.is_current()
+
+    def probe_video(self):
+        VideoProbe.probe(self.video)
+        process_cache.invalidate(FRAGMENT_VERSION_KEY)
 
     english_title = RichTextField(
         features=[], blank=False, null=True
@@ -323,6 +359,22 @@ class ShortVideoPage(
         help_text='It has to start with a farsi word'
     )
 
+    english_title_text = models.TextField(default='', editable=False)
+    farsi_title_text = models.TextField(default='', editable=False)
+    english_title_short = models.CharField(max_length=70, default='', editable=False)
+    farsi_title_short = models.CharField(max_length=70, default='', editable=False)
+    english_caption_text = models.TextField(default='', editable=False)
+    farsi_caption_text = models.TextField(default='', editable=False)
+
+    plain_text_columns = {
+        'english_title_text': ('english_title', None),
+        'farsi_title_text': ('farsi_title', None),
+        'english_title_short': ('english_title', 70),
+        'farsi_title_short': ('farsi_title', 70),
+        'english_caption_text': ('english_caption', None),
+        'farsi_caption_text': ('farsi_caption', None),
+    }
+
     english_tags = ClusterTaggableManager(
         through=ShortVideoPageEnglishTag, blank=True, related_name='english_tags'
     )
@@ -377,19 +429,11 @@ class ShortVideoPage(
     def serve(self, request, *args, **kwargs):
         language = translation.get_language()
         if language == 'fa':
-            self.search_description = text_processing.html_to_str(
-                self.english_caption
-            )
-            self.seo_title = text_processing.html_to_str(
-                self.english_title
-            )
+            self.search_description = self.english_caption_text
+            self.seo_title = self.english_title_text
         else:
-            self.search_description = text_processing.html_to_str(
-                self.farsi_caption
-            )
-            self.seo_title = text_processing.html_to_str(
-                self.farsi_title
-            )
+            self.search_description = self.farsi_caption_text
+            self.seo_title = self.farsi_title_text
         return super().serve(request, *args, **kwargs)
 
     def clean(self):
@@ -431,7 +475,7 @@ class ShortVideoPage(
 
 class ShortVideosPage(
     AllDotaPageMixin, LogoContainingPageMixin,
-    MetadataPageMixin, HeroesPageMixin, MultilingualPageMixin, Page
+    MetadataPageMixin, HeroesPageMixin, MultilingualPageMixin, ListingPageMixin, Page
 ):
     content_panels = []
     promote_panels = []
@@ -455,26 +499,14 @@ class ShortVideosPage(
             self.seo_title = 'Dota 2 short short_videos'
         return super().serve(request, *args, **kwargs)
 
-    @staticmethod
-    def get_row_posts(posts):
-        return list(
-            reversed(list_processing.list_to_sublists_of_size_n(posts, 2))
-        )
+    listing_related_fields = ['video_thumbnail', 'video__probe__thumbnail', 'video__probe__sprite']
+    listing_image_field = 'thumbnail'
+    listing_rows_template = 'home/posts/short_videos/videos_page/rows.html'
 
-    def get_context(self, request, *args, **kwargs):
-        context = super().get_context(request, *args, **kwargs)
-        children = self.get_children().live().public()
-        paginator = Paginator(children, 5)
-        page = request.GET.get('page')
-        try:
-            posts = paginator.page(page)
-        except PageNotAnInteger:
-            posts = paginator.page(1)
-        except EmptyPage:
-            posts = paginator.page(paginator.num_pages)
-        context['row_posts'] = self.get_row_posts(posts)
-        context['posts'] = posts
-        return context
+    def get_listing_title(self, post):
+        if self.template_language == 'fa':
+            return post.farsi_title_short
+        return post.english_title_short
 
     @property
     def template(self):
@@ -503,7 +535,7 @@ class ShortPostPageFarsiTag(TaggedItemBase):
 
 class ShortPostPage(
     AllDotaPageMixin, LogoContainingPageMixin,
-    MetadataPageMixin, MultilingualPageMixin, Page
+    MetadataPageMixin, MultilingualPageMixin, PlainTextColumnsMixin, Page
 ):
     image = models.ForeignKey(
         'wagtailimages.Image',
@@ -519,6 +551,18 @@ class ShortPostPage(
         help_text='It has to start with a farsi word'
     )
 
+    english_caption_text = models.TextField(default='', editable=False)
+    farsi_caption_text = models.TextField(default='', editable=False)
+    english_caption_short = models.CharField(max_length=300, default='', editable=False)
+    farsi_caption_short = models.CharField(max_length=300, default='', editable=False)
+
+    plain_text_columns = {
+        'english_caption_text': ('english_caption', None),
+        'farsi_caption_text': ('farsi_caption', None),
+        'english_caption_short': ('english_caption', 300),
+        'farsi_caption_short': ('farsi_caption', 300),
+    }
+
     english_tags = ClusterTaggableManager(
         through=ShortPostPageEnglishTag, blank=True, related_name='short_post_english_tags'
     )
@@ -571,14 +615,10 @@ class ShortPostPage(
     def serve(self, request, *args, **kwargs):
         language = translation.get_language()
         if language == 'en':
-            self.search_description = text_processing.html_to_str(
-                self.english_caption
-            )
+            self.search_description = self.english_caption_text
             self.seo_title = self.title
         else:
-            self.search_description = text_processing.html_to_str(
-                self.farsi_caption
-            )
+            self.search_description = self.farsi_caption_text
             self.seo_title = self.title
         return super().serve(request, *args, **kwargs)
 
@@ -621,7 +661,7 @@ class ShortPostPage(
 
 class ShortPostsPage(
     AllDotaPageMixin, LogoContainingPageMixin,
-    MetadataPageMixin, MultilingualPageMixin, Page
+    MetadataPageMixin, MultilingualPageMixin, ListingPageMixin, Page
 ):
     content_panels = []
     promote_panels = []
@@ -645,26 +685,15 @@ class ShortPostsPage(
             self.seo_title = self.search_description
         return super().serve(request, *args, **kwargs)
 
-    @staticmethod
-    def get_row_posts(posts):
-        return list(
-            reversed(list_processing.list_to_sublists_of_size_n(posts, 2))
-        )
+    listing_related_fields = ['image']
+    listing_image_field = 'image'
+    listing_image_filter_spec = 'fill-1000x600-c100'
+    listing_rows_template = 'home/posts/short_posts/posts_page/rows.html'
 
-    def get_context(self, request, *args, **kwargs):
-        context = super().get_context(request, *args, **kwargs)
-        children = self.get_children().live().public()
-        paginator = Paginator(children, 5)
-        page = request.GET.get('page')
-        try:
-            posts = paginator.page(page)
-        except PageNotAnInteger:
-            posts = paginator.page(1)
-        except EmptyPage:
-            posts = paginator.page(paginator.num_pages)
-        context['row_posts'] = self.get_row_posts(posts)
-        context['posts'] = posts
-        return context
+    def get_listing_title(self, post):
+        if self.template_language == 'fa':
+            return post.farsi_caption_short
+        return post.english_caption_short
 
     @property
     def template(self):
@@ -681,7 +710,7 @@ class ShortPostsPage(
 
 class BlogsPage(
     AllDotaPageMixin, LogoContainingPageMixin,
-    MetadataPageMixin, MultilingualPageMixin, Page
+    MetadataPageMixin, MultilingualPageMixin, ListingPageMixin, Page
 ):
     content_panels = []
     promote_panels = []
@@ -707,26 +736,16 @@ class BlogsPage(
             self.search_description = self.seo_title + ' including images, videos, posts about Dota 2'
         return super().serve(request, *args, **kwargs)
 
-    @staticmethod
-    def get_row_posts(posts):
-        return list(
-            reversed(list_processing.list_to_sublists_of_size_n(posts, 2))
-        )
+    listing_related_fields = ['image', 'farsi_content', 'english_content']
+    listing_image_field = 'image'
+    listing_rows_template = 'home/posts/alldota_posts/posts_page/rows.html'
 
-    def get_context(self, request, *args, **kwargs):
-        context = super().get_context(request, *args, **kwargs)
-        children = self.get_children().live().public()
-        paginator = Paginator(children, 5)
-        page = request.GET.get('page')
-        try:
-            posts = paginator.page(page)
-        except PageNotAnInteger:
-            posts = paginator.page(1)
-        except EmptyPage:
-            posts = paginator.page(paginator.num_pages)
-        context['row_posts'] = self.get_row_posts(posts)
-        context['posts'] = posts
-        return context
+    def get_listing_title(self, post):
+        if self.template_language == 'fa':
+            content = post.farsi_content
+        else:
+            content = post.english_content
+        return content.post_title_short if content else ''
 
     @property
     def template(self):
@@ -835,23 +854,15 @@ class AllDotaBlogPost1(
 
     def set_english_seo(self):
         self.seo_title = 'Blogs - {}'.format(
-            text_processing.html_to_str(
-                self.english_content.post_title
-            )
-        )
-        self.search_description = text_processing.html_to_str(
-            self.english_content.post_summary
+            self.english_content.post_title_text
         )
+        self.search_description = self.english_content.post_summary_text
 
     def set_farsi_seo(self):
         self.seo_title = 'وبلاگ - {}'.format(
-            text_processing.html_to_str(
-                self.farsi_content.post_title
-            )
-        )
-        self.search_description = text_processing.html_to_str(
-            self.farsi_content.post_summary
+            self.farsi_content.post_title_text
         )
+        self.search_description = self.farsi_content.post_summary_text
 
     def serve(self, request, *args, **kwargs):
         language = translation.get_language()
@@ -867,6 +878,11 @@ class AllDotaBlogPost1(
                 self.set_farsi_seo()
         return super().serve(request, *args, **kwargs)
 
+    def get_context(self, request, *args, **kwargs):
+        context = super().get_context(request, *args, **kwargs)
+        context['post_body'] = rendering.render_post_body(self, request)
+        return context
+
     def set_uuid4(self):
         uuid4 = uuid.uuid4()
         while AllDotaBlogPost1.objects.filter(uuid4=uuid4).exists():
@@ -0,0 +1,101 @@
+from django.conf import settings
+from wagtail.images.image_operations import Operation
+from wagtail.images.models import Filter
+from willow.image import WebPImageFile
+from willow.plugins.pillow import PillowImage
+
+WEBP = 'webp'
+MIME_TYPES = {
+    WEBP: 'image/webp',
+}
+DEFAULT_QUALITY = {
+    WEBP: 80,
+}
+# json clients cannot ask for images in their accept header, the api takes the format as a parameter
+IMAGE_FORMAT_PARAMETER = 'image_format'
+
+_filters = {}
+
+
+def get_quality(image_format):
+    quality = dict(DEFAULT_QUALITY, **getattr(settings, 'IMAGE_FORMAT_QUALITY', {}))
+    return quality.get(image_format)
+
+
+def get_accepted_types(accept):
+    accepted = set()
+    for entry in accept.split(','):
+        media_type, *params = entry.split(';')
+        quality = 1.0
+        for param in params:
+            name, _, value = param.partition('=')
+            if name.strip().lower() == 'q':
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        # q=0 explicitly refuses the type
+        if quality > 0:
+            accepted.add(media_type.strip().lower())
+    return accepted
+
+
+def get_image_format(request):
+    if request is None:
+        return None
+    if MIME_TYPES[WEBP] in get_accepted_types(request.META.get('HTTP_ACCEPT', '')):
+        return WEBP
+    return None
+
+
+def get_filter_spec(filter_spec, image_format):
+    if image_format == WEBP:
+        # webpquality also sets the output format, jpeg settings do not apply to webp
+        operations = [
+            operation for operation in filter_spec.split('|')
+            if not operation.startswith('jpegquality-')
+        ]
+        return '|'.join(operations + ['webpquality-{}'.format(get_quality(WEBP))])
+    # jpeg and png renditions keep their spec unless a jpeg quality is configured
+    quality = get_quality('jpeg')
+    if quality and 'jpegquality-' not in filter_spec:
+        return '{}|jpegquality-{}'.format(filter_spec, quality)
+    return filter_spec
+
+
+def negotiate(filter_spec, request):
+    return get_filter_spec(filter_spec, get_image_format(request))
+
+
+def get_format_filter(filter_spec, image_format):
+    filter_spec = get_filter_spec(filter_spec, image_format)
+    if filter_spec not in _filters:
+        _filters[filter_spec] = Filter(spec=filter_spec)
+    return _filters[filter_spec]
+
+
+def get_filter(filter_spec, request):
+    return get_format_filter(filter_spec, get_image_format(request))
+
+
+class QualityWebPImage(PillowImage):
+    def __init__(self, image, quality):
+        super().__init__(image)
+        self.quality = quality
+
+    def save_as_webp(self, f):
+        self.image.save(f, 'WEBP', quality=self.quality)
+        return WebPImageFile(f)
+
+
+class WebPQualityOperation(Operation):
+    # wagtail saves webp renditions with the encoder default, so this has to be the last operation
+    def construct(self, quality):
+        self.quality = int(quality)
+
+    def run(self, willow, image, env):
+        # other backends keep the source format rather than encode webp at an unknown quality
+        if isinstance(willow, PillowImage):
+            env['output-format'] = WEBP
+            return QualityWebPImage(willow.image, self.quality)
+
@@ -0,0 +1,34 @@
+from django.core.cache import cache
+from django.db import transaction
+
+_entries = {}
+
+
+def _version_key(key):
+    return 'process-cache-version:{}'.format(key)
+
+
+def get_version(key):
+    return cache.get(_version_key(key), 0)
+
+
+def get(key, build):
+    version = get_version(key)
+    entry = _entries.get(key)
+    if entry is None or entry[0] != version:
+        entry = (version, build())
+        _entries[key] = entry
+    return entry[1]
+
+
+def _bump(key):
+    _entries.pop(key, None)
+    try:
+        cache.incr(_version_key(key))
+    except ValueError:
+        cache.set(_version_key(key), 1, None)
+
+
+def invalidate(*keys):
+    for key in keys:
+        transaction.on_commit(lambda key=key: _bump(key))
@@ -0,0 +1,34 @@
+from wagtail.core.blocks import StreamValue
+
+
+def get_snippet_ids(stream, block_name):
+    if stream.is_lazy:
+        return [
+            child['value'] for child in stream.stream_data
+            if child['type'] == block_name and child['value']
+        ]
+    return [
+        child.value.pk for child in stream
+        if child.block_type == block_name and child.value
+    ]
+
+
+def prefetch_snippets(instances, field_name, block_name, queryset):
+    streams = [getattr(instance, field_name) for instance in instances]
+    snippet_ids = set()
+    for stream in streams:
+        if stream.is_lazy:
+            snippet_ids.update(get_snippet_ids(stream, block_name))
+    snippets = queryset.in_bulk(snippet_ids)
+    for instance, stream in zip(instances, streams):
+        if not stream.is_lazy:
+            continue
+        stream_data = []
+        for child in stream.stream_data:
+            if child['type'] == block_name:
+                value = snippets.get(child['value'])
+            else:
+                child_block = stream.stream_block.child_blocks[child['type']]
+                value = child_block.to_python(child['value'])
+            stream_data.append((child['type'], value, child.get('id')))
+        setattr(instance, field_name, StreamValue(stream.stream_block, stream_data))
@@ -1,16 +1,143 @@
+import hashlib
 import re
+import threading
+from collections import OrderedDict
+from html.entities import codepoint2name
+from html.parser import HTMLParser
 
-from bs4 import BeautifulSoup
+
+HTML_TO_STR_CACHE_SIZE = 4096
+ASCII_SPACES = '\x20\x0a\x09\x0c\x0d'
+EMPTY_ELEMENT_TAGS = frozenset([
+    'area', 'base', 'br', 'col', 'embed', 'hr', 'img', 'input', 'keygen', 'link',
+    'menuitem', 'meta', 'param', 'source', 'track', 'wbr', 'spacer', 'frame',
+])
+PRESERVE_WHITESPACE_TAGS = frozenset(['pre', 'textarea'])
+ENTITY_TO_CHARACTER = {name: chr(codepoint) for codepoint, name in codepoint2name.items()}
+
+_html_to_str_cache = OrderedDict()
+_html_to_str_lock = threading.Lock()
+
+
+class ParagraphTextParser(HTMLParser):
+    # streams the markup and keeps only the text of <p> elements, following the
+    # same tag closing and whitespace rules BeautifulSoup's html.parser tree uses
+    def __init__(self):
+        super().__init__(convert_charrefs=False)
+        self.paragraphs = []
+        self.open_paragraphs = []
+        self.open_tags = []
+        self.closed_empty_elements = []
+        self.preserved_whitespace = 0
+        self.data = []
+
+    def flush(self):
+        if not self.data:
+            return
+        data = ''.join(self.data)
+        self.data = []
+        if not self.preserved_whitespace and not data.strip(ASCII_SPACES):
+            data = '\n' if '\n' in data else ' '
+        for paragraph in self.open_paragraphs:
+            paragraph.append(data)
+
+    def push_tag(self, tag):
+        self.open_tags.append(tag)
+        if tag == 'p':
+            paragraph = []
+            self.paragraphs.append(paragraph)
+            self.open_paragraphs.append(paragraph)
+        if tag in PRESERVE_WHITESPACE_TAGS:
+            self.preserved_whitespace += 1
+
+    def pop_to_tag(self, tag):
+        self.flush()
+        while self.open_tags:
+            popped = self.open_tags.pop()
+            if popped == 'p':
+                self.open_paragraphs.pop()
+            if popped in PRESERVE_WHITESPACE_TAGS:
+                self.preserved_whitespace -= 1
+            if popped == tag:
+                break
+
+    def handle_starttag(self, tag, attrs, handle_empty_element=True):
+        self.flush()
+        self.push_tag(tag)
+        if handle_empty_element and tag in EMPTY_ELEMENT_TAGS:
+            self.handle_endtag(tag, check_already_closed=False)
+            self.closed_empty_elements.append(tag)
+
+    def handle_startendtag(self, tag, attrs):
+        self.handle_starttag(tag, attrs, handle_empty_element=False)
+        self.handle_endtag(tag)
+
+    def handle_endtag(self, tag, check_already_closed=True):
+        if check_already_closed and tag in self.closed_empty_elements:
+            self.closed_empty_elements.remove(tag)
+        else:
+            self.pop_to_tag(tag)
+
+    def handle_data(self, data):
+        self.data.append(data)
+
+    def handle_charref(self, name):
+        if name.startswith(('x', 'X')):
+            codepoint = int(name[1:], 16)
+        else:
+            codepoint = int(name)
+        try:
+            self.data.append(chr(codepoint))
+        except (ValueError, OverflowError):
+            self.data.append('\N{REPLACEMENT CHARACTER}')
+
+    def handle_entityref(self, name):
+        self.data.append(ENTITY_TO_CHARACTER.get(name, '&{};'.format(name)))
+
+    def handle_comment(self, data):
+        self.flush()
+
+    def handle_decl(self, data):
+        self.flush()
+
+    def handle_pi(self, data):
+        self.flush()
+
+    def unknown_decl(self, data):
+        self.flush()
+        if data.upper().startswith('CDATA['):
+            self.data.append(data[len('CDATA['):])
+            self.flush()
+
+    def get_paragraphs(self):
+        return [''.join(paragraph).strip() for paragraph in self.paragraphs]
+
+
+def extract_paragraphs(html):
+    parser = ParagraphTextParser()
+    parser.feed(html)
+    parser.flush()
+    return parser.get_paragraphs()
 
 
 def html_to_str(html, break_line=False):
-    soup = BeautifulSoup(html, 'html.parser')
+    key = (hashlib.sha1(html.encode('utf-8')).digest(), break_line)
+    with _html_to_str_lock:
+        result = _html_to_str_cache.get(key)
+        if result is not None:
+            _html_to_str_cache.move_to_end(key)
+            return result
     result = ''
-    for paragraph in soup.find_all('p'):
-        result += (paragraph.get_text().strip() + '\n')
+    for paragraph in extract_paragraphs(html):
+        result += (paragraph + '\n')
     if not break_line:
         result = result.replace('\n', ' ')
-    return result.strip()
+    result = result.strip()
+    with _html_to_str_lock:
+        _html_to_str_cache[key] = result
+        if len(_html_to_str_cache) > HTML_TO_STR_CACHE_SIZE:
+            _html_to_str_cache.popitem(last=False)
+    return result
 
 
 def upper_camel_to_snake(name):
@@ -1,3 +1,136 @@
+import re
+
+from wagtail.images import get_image_model
+from wagtail.images.models import Filter
+from wagtail.images.shortcuts import get_rendition_or_not_found
+from wagtail.search import index
+
+from ..blogs.rendering import IMAGE_VERSION_KEY
+from . import image_formats, process_cache
+
+RESPONSIVE_WIDTHS = (480, 800, 1200, 1600, 2400)
+FILL_SPEC_PATTERN = re.compile(r'^fill-(\d+)x(\d+)(-c\d+)?$')
+# name -> (filter spec of the largest rendition, sizes attribute)
+RENDITION_SETS = {
+    'post-image': ('fill-4000x2000', '(min-width: 768px) 75vw, 100vw'),
+    'section-image': ('original', '(min-width: 768px) 40vw, 100vw'),
+    'section-image-row': ('fill-1000x1000', '(min-width: 768px) 30vw, 100vw'),
+    'introduction-background': ('fill-3000x2000', '(min-width: 992px) 50vw, 100vw'),
+}
+# caches the image post_save receivers retire, bulk_update does not send the signal
+IMAGE_CACHE_KEYS = ('hero-roster', 'hero-property-image', 'active-logo', IMAGE_VERSION_KEY)
+
+
 def set_title(wagtail_image, title):
     wagtail_image.title = title
     wagtail_image.save()
+
+
+def set_titles(image_titles):
+    changed_images = {}
+    for wagtail_image, title in image_titles:
+        if wagtail_image and wagtail_image.title != title:
+            wagtail_image.title = title
+            changed_images[wagtail_image.pk] = wagtail_image
+    if changed_images:
+        get_image_model().objects.bulk_update(
+            changed_images.values(), ['title']
+        )
+        for wagtail_image in changed_images.values():
+            index.insert_or_update_object(wagtail_image)
+        process_cache.invalidate(*IMAGE_CACHE_KEYS)
+    return len(changed_images)
+
+
+def get_rendition_sets(image_specs):
+    # image_specs maps each image to the filter specs wanted for it
+    images = {image.pk: image for image in image_specs if image}
+    if not images:
+        return {}
+    filters = {
+        spec: Filter(spec=spec)
+        for image, specs in image_specs.items() if image for spec in specs
+    }
+    Rendition = get_image_model().get_rendition_model()
+    rendition_sets = {pk: {} for pk in images}
+    for rendition in Rendition.objects.filter(
+        image_id__in=images.keys(), filter_spec__in=filters.keys()
+    ):
+        image = images[rendition.image_id]
+        image_filter = filters[rendition.filter_spec]
+        if rendition.filter_spec in image_specs[image] and \
+                rendition.focal_point_key == image_filter.get_cache_key(image):
+            rendition.image = image
+            rendition_sets[image.pk][rendition.filter_spec] = rendition
+    for pk, image in images.items():
+        for spec in image_specs[image]:
+            if spec not in rendition_sets[pk]:
+                # a missing source file renders as not found, like the image tag
+                rendition_sets[pk][spec] = get_rendition_or_not_found(image, filters[spec])
+    return rendition_sets
+
+
+def get_renditions(images, filter_spec):
+    rendition_sets = get_rendition_sets({image: [filter_spec] for image in images if image})
+    return {pk: renditions[filter_spec] for pk, renditions in rendition_sets.items()}
+
+
+def preload_renditions(images, filter_spec):
+    images = [
+        image for image in images
+        if image and filter_spec not in getattr(image, '_preloaded_renditions', {})
+    ]
+    renditions = get_renditions(images, filter_spec)
+    for image in images:
+        if not hasattr(image, '_preloaded_renditions'):
+            image._preloaded_renditions = {}
+        image._preloaded_renditions[filter_spec] = renditions[image.pk]
+
+
+def get_rendition(image, filter_spec):
+    if not image:
+        return None
+    preloaded_renditions = getattr(image, '_preloaded_renditions', {})
+    if filter_spec in preloaded_renditions:
+        return preloaded_renditions[filter_spec]
+    return get_rendition_or_not_found(image, filter_spec)
+
+
+def get_responsive_specs(image, filter_spec):
+    largest_width = RESPONSIVE_WIDTHS[-1]
+    match = FILL_SPEC_PATTERN.match(filter_spec)
+    if match:
+        width, height = int(match.group(1)), int(match.group(2))
+        crop = match.group(3) or ''
+
+        def get_spec(spec_width):
+            return 'fill-{}x{}{}'.format(spec_width, round(height * spec_width / width), crop)
+        # the crop keeps the aspect ratio, so the shorter side can limit the width
+        available_width = min(width, image.width, image.height * width / height)
+        largest = filter_spec if width <= largest_width else get_spec(largest_width)
+    elif filter_spec == 'original':
+        get_spec = 'width-{}'.format
+        available_width = image.width
+        largest = filter_spec if image.width <= largest_width else get_spec(largest_width)
+    else:
+        return [filter_spec]
+    return [
+        get_spec(spec_width) for spec_width in RESPONSIVE_WIDTHS
+        if spec_width < min(available_width, largest_width)
+    ] + [largest]
+
+
+def get_rendition_set(image, name, image_format=None):
+    specs = [
+        image_formats.get_filter_spec(spec, image_format)
+        for spec in get_responsive_specs(image, RENDITION_SETS[name][0])
+    ]
+    preloaded_renditions = getattr(image, '_preloaded_renditions', {})
+    missing_specs = [spec for spec in specs if spec not in preloaded_renditions]
+    renditions = dict(preloaded_renditions)
+    if missing_specs:
+        renditions.update(get_rendition_sets({image: missing_specs})[image.pk])
+    rendition_set = {}
+    for spec in specs:
+        rendition_set.setdefault(renditions[spec].width, renditions[spec])
+    return [rendition_set[width] for width in sorted(rendition_set)]
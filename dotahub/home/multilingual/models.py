@@ -6,6 +6,7 @@ from wagtail.images.edit_handlers import ImageChooserPanel
 from wagtail.snippets.models import register_snippet
 
 from ..modules import text_processing
+from . import url_map
 
 
 class MultilingualPageMixin:
@@ -19,7 +20,15 @@ class MultilingualPageMixin:
 
     @property
     def template_language(self):
+        # pages live for one request, so remember the answer per active language
         lang = translation.get_language()
+        cached = getattr(self, '_template_language', None)
+        if cached is None or cached[0] != lang:
+            cached = (lang, self.get_template_language(lang))
+            self._template_language = cached
+        return cached[1]
+
+    def get_template_language(self, lang):
         if lang == 'fa':
             if self.farsi_translated:
                 return 'fa'
@@ -49,13 +58,27 @@ class MultilingualPageMixin:
 
     @property
     def template_name(self):
-        return text_processing.upper_camel_to_snake(
-            self.__class__.__name__
-        )
+        return self.get_template_name()
 
     @property
     def template_file(self):
-        return self.template_name + '.html'
+        return self.get_template_file()
+
+    @classmethod
+    def get_template_name(cls):
+        template_name = cls.__dict__.get('_template_name')
+        if template_name is None:
+            template_name = text_processing.upper_camel_to_snake(cls.__name__)
+            cls._template_name = template_name
+        return template_name
+
+    @classmethod
+    def get_template_file(cls):
+        template_file = cls.__dict__.get('_template_file')
+        if template_file is None:
+            template_file = cls.get_template_name() + '.html'
+            cls._template_file = template_file
+        return template_file
 
     @staticmethod
     def get_farsi_language():
@@ -72,10 +95,11 @@ class MultilingualPageMixin:
         return self.get_language_url('en')
 
     def get_language_url(self, lang):
-        current_lang = translation.get_language()
-        translation.activate(lang)
-        url = self.get_url()
-        translation.activate(current_lang)
+        url = url_map.get_url(self.pk, lang)
+        if url is None:
+            # pages that are not live, e.g. previews, are not in the url map
+            with translation.override(lang):
+                url = self.get_url()
         return url
 
 
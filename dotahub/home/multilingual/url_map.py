@@ -0,0 +1,24 @@
+from django.utils import translation
+from wagtail.core.models import Page
+
+from ..modules import process_cache
+
+LANGUAGES = ('fa', 'en')
+
+
+def build_url_map():
+    pages = list(Page.objects.live().only('id', 'url_path'))
+    url_map = {}
+    for language in LANGUAGES:
+        with translation.override(language):
+            for page in pages:
+                url_map[(page.pk, language)] = page.get_url()
+    return url_map
+
+
+def get_url_map():
+    return process_cache.get('multilingual-url-map', build_url_map)
+
+
+def get_url(page_id, language):
+    return get_url_map().get((page_id, language))
@@ -0,0 +1,23 @@
+from django.utils.text import Truncator
+
+from ..modules import text_processing
+
+
+class PlainTextColumnsMixin:
+    # column name -> (rich text field, truncate length or None)
+    plain_text_columns = {}
+
+    @classmethod
+    def get_plain_text_column_names(cls):
+        return list(cls.plain_text_columns)
+
+    def refresh_plain_text_columns(self):
+        for column, (field_name, length) in self.plain_text_columns.items():
+            text = text_processing.html_to_str(getattr(self, field_name) or '')
+            if length:
+                text = Truncator(text).chars(length)
+            setattr(self, column, text)
+
+    def save(self, *args, **kwargs):
+        self.refresh_plain_text_columns()
+        super().save(*args, **kwargs)
@@ -0,0 +1,136 @@
+from django.db.models.signals import m2m_changed, post_delete, post_save
+from django.dispatch import receiver
+from wagtail.core.models import Page, PageViewRestriction, Site
+from wagtail.core.signals import page_published, page_unpublished
+from wagtail.images.models import Image
+
+from .blogs.rendering import IMAGE_VERSION_KEY
+from .listing.models import COUNT_VERSION_KEY, FRAGMENT_VERSION_KEY
+from .models import (
+    AllDotaBlogPost1, Ability, BlogPost, BlogsPage, Hero, HeroAttackType, HeroPage,
+    HeroPropertyImage, HeroRole, HeroType, Logo, ShortPostPage, ShortPostsPage, ShortVideoPage,
+    ShortVideosPage, ThumbnailJob, VideoProbe,
+)
+from .modules import process_cache
+
+LISTED_MODELS = (
+    ShortVideosPage, ShortVideoPage, ShortPostsPage, ShortPostPage, BlogsPage, AllDotaBlogPost1, BlogPost,
+)
+LISTED_PAGE_MODELS = (ShortVideoPage, ShortPostPage, AllDotaBlogPost1)
+
+
+@receiver(post_save, sender=Hero)
+@receiver(post_delete, sender=Hero)
+@receiver(post_save, sender=HeroPage)
+@receiver(post_delete, sender=HeroPage)
+@receiver(page_published, sender=HeroPage)
+@receiver(page_unpublished, sender=HeroPage)
+@receiver(post_save, sender=HeroType)
+@receiver(post_save, sender=Image)
+def invalidate_hero_roster(sender, **kwargs):
+    process_cache.invalidate('hero-roster')
+
+
+@receiver(post_save, sender=HeroPropertyImage)
+@receiver(post_delete, sender=HeroPropertyImage)
+@receiver(post_save, sender=Image)
+@receiver(post_delete, sender=Image)
+def invalidate_hero_property_image(sender, **kwargs):
+    process_cache.invalidate('hero-property-image')
+
+
+@receiver(post_save, sender=Logo)
+@receiver(post_delete, sender=Logo)
+@receiver(post_save, sender=Image)
+@receiver(post_delete, sender=Image)
+def invalidate_active_logo(sender, **kwargs):
+    process_cache.invalidate('active-logo')
+
+
+@receiver(post_save, sender=Image)
+@receiver(post_delete, sender=Image)
+def invalidate_blog_bodies(sender, **kwargs):
+    process_cache.invalidate(IMAGE_VERSION_KEY)
+
+
+@receiver(post_save, sender=Hero)
+@receiver(post_delete, sender=Hero)
+def invalidate_hero_level_table(sender, **kwargs):
+    process_cache.invalidate('hero-level-table')
+
+
+@receiver(post_save, sender=Hero)
+@receiver(post_delete, sender=Hero)
+@receiver(post_save, sender=Ability)
+@receiver(post_delete, sender=Ability)
+def invalidate_autocomplete_index(sender, **kwargs):
+    process_cache.invalidate('autocomplete-index')
+
+
+@receiver(post_save, sender=Hero)
+@receiver(post_delete, sender=Hero)
+@receiver(post_save, sender=HeroType)
+@receiver(post_delete, sender=HeroType)
+@receiver(post_save, sender=HeroAttackType)
+@receiver(post_delete, sender=HeroAttackType)
+@receiver(post_save, sender=HeroRole)
+@receiver(post_delete, sender=HeroRole)
+@receiver(m2m_changed, sender=Hero.attack_types.through)
+def invalidate_hero_facet_index(sender, **kwargs):
+    process_cache.invalidate('hero-facet-index')
+
+
+@receiver(post_save)
+@receiver(post_delete)
+def invalidate_multilingual_url_map_on_page_change(sender, instance, update_fields=None, **kwargs):
+    # revision saves only touch draft bookkeeping fields, which do not affect urls
+    if isinstance(instance, Page) and (
+        update_fields is None or {'slug', 'url_path'} & set(update_fields)
+    ):
+        process_cache.invalidate('multilingual-url-map')
+
+
+@receiver(page_published)
+@receiver(page_unpublished)
+@receiver(post_save, sender=Site)
+@receiver(post_delete, sender=Site)
+def invalidate_multilingual_url_map(sender, **kwargs):
+    process_cache.invalidate('multilingual-url-map')
+
+
+@receiver(post_save)
+@receiver(post_delete)
+def invalidate_listing_fragments(sender, instance, update_fields=None, **kwargs):
+    # publishing and unpublishing save the whole page, draft revisions only save bookkeeping fields;
+    # moves save the generic Page, so pages are matched by their specific class
+    model = (instance.specific_class or Page) if isinstance(instance, Page) else sender
+    if update_fields is None and issubclass(model, LISTED_MODELS):
+        process_cache.invalidate(FRAGMENT_VERSION_KEY)
+
+
+@receiver(post_save)
+@receiver(post_delete)
+def invalidate_listing_counts_on_page_change(sender, instance, update_fields=None, **kwargs):
+    # moves save the generic Page, so look at the specific class instead of the sender
+    if isinstance(instance, Page) and update_fields is None and issubclass(
+        instance.specific_class or Page, LISTED_PAGE_MODELS
+    ):
+        process_cache.invalidate(COUNT_VERSION_KEY)
+
+
+@receiver(post_save, sender=PageViewRestriction)
+@receiver(post_delete, sender=PageViewRestriction)
+def invalidate_listings_on_privacy_change(sender, **kwargs):
+    process_cache.invalidate(COUNT_VERSION_KEY, FRAGMENT_VERSION_KEY)
+
+
+@receiver(page_published, sender=ShortVideoPage)
+def enqueue_video_probe(sender, instance, **kwargs):
+    if instance.needs_probing:
+        ThumbnailJob.enqueue(instance)
+
+
+@receiver(post_delete, sender=VideoProbe)
+def delete_video_probe_images(sender, instance, **kwargs):
+    Image.objects.filter(pk__in=[instance.thumbnail_id, instance.sprite_id]).delete()
+    process_cache.invalidate(FRAGMENT_VERSION_KEY)
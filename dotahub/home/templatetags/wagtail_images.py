@@ -0,0 +1,80 @@
+from django import template
+from django.forms.utils import flatatt
+from django.utils.html import format_html
+from wagtail.images.shortcuts import get_rendition_or_not_found
+from wagtail.images.templatetags import wagtailimages_tags
+
+from ..modules import image_formats, wagtail_images
+
+register = template.Library()
+
+
+class NegotiatedImageNode(wagtailimages_tags.ImageNode):
+    def render(self, context):
+        try:
+            image = self.image_expr.resolve(context)
+        except template.VariableDoesNotExist:
+            return ''
+
+        if not image:
+            return ''
+
+        if not hasattr(image, 'get_rendition'):
+            raise ValueError('image tag expected an Image object, got {!r}'.format(image))
+
+        rendition = get_rendition_or_not_found(
+            image, image_formats.get_filter(self.filter_spec, context.get('request'))
+        )
+
+        if self.output_var_name:
+            context[self.output_var_name] = rendition
+            return ''
+        resolved_attrs = {}
+        for key in self.attrs:
+            resolved_attrs[key] = self.attrs[key].resolve(context)
+        return rendition.img_tag(resolved_attrs)
+
+
+@register.tag(name='image')
+def image(parser, token):
+    node = wagtailimages_tags.image(parser, token)
+    return NegotiatedImageNode(
+        node.image_expr, node.filter_spec, output_var_name=node.output_var_name, attrs=node.attrs
+    )
+
+
+@register.simple_tag(name='preload_renditions', takes_context=True)
+def preload_renditions(context, images, filter_spec):
+    wagtail_images.preload_renditions(
+        images, image_formats.negotiate(filter_spec, context.get('request'))
+    )
+    return ''
+
+
+@register.simple_tag(name='rendition', takes_context=True)
+def rendition(context, image, filter_spec):
+    return wagtail_images.get_rendition(
+        image, image_formats.negotiate(filter_spec, context.get('request'))
+    )
+
+
+@register.simple_tag(name='responsive_image', takes_context=True)
+def responsive_image(context, image, name, **attributes):
+    if not image:
+        return ''
+    renditions = wagtail_images.get_rendition_set(
+        image, name, image_formats.get_image_format(context.get('request'))
+    )
+    largest = renditions[-1]
+    attributes = dict({
+        'src': largest.url,
+        'srcset': ', '.join(
+            '{} {}w'.format(rendition.url, rendition.width) for rendition in renditions
+        ),
+        'sizes': wagtail_images.RENDITION_SETS[name][1],
+        'width': largest.width,
+        'height': largest.height,
+        'alt': largest.alt,
+        'loading': 'lazy',
+    }, **attributes)
+    return format_html('<img{}>', flatatt(attributes))
@@ -0,0 +1,83 @@
+import json
+
+from django.test import RequestFactory, SimpleTestCase, TestCase, override_settings
+from wagtailmedia.models import get_media_model
+
+from .heroes.models import Ability, Hero, HeroAttackType, HeroRole, HeroType
+from .modules import image_formats
+
+
+@override_settings(WAGTAILAPI_LIMIT_MAX=None)
+class HeroAPIQueryCountTest(TestCase):
+    hero_count = 120
+    query_count = 6
+
+    @classmethod
+    def setUpTestData(cls):
+        hero_types = [HeroType.objects.create(name=name) for name in ('Strength', 'Agility', 'Intelligence')]
+        attack_types = [HeroAttackType.objects.create(name=name) for name in ('Melee', 'Ranged')]
+        roles = [HeroRole.objects.create(name=name) for name in ('Carry', 'Support', 'Nuker', 'Disabler')]
+        abilities = [
+            Ability.objects.create(name='Ability{}'.format(i), summary='<p>s</p>', farsi_summary='<p>s</p>')
+            for i in range(8)
+        ]
+        for i in range(cls.hero_count):
+            hero = Hero(
+                name='Hero{}'.format(i), farsi_name='هيرو{}'.format(i), ego=['Radiant', 'Dire'][i % 2],
+                hero_type=hero_types[i % 3], biography='<p>bio</p>',
+            )
+            hero.roles = json.dumps([
+                {'type': 'role', 'value': roles[i % 4].pk},
+                {'type': 'role', 'value': roles[(i + 1) % 4].pk},
+            ])
+            hero.hero_abilities = json.dumps([
+                {'type': 'ability', 'value': abilities[(i + k) % 8].pk} for k in range(4)
+            ])
+            hero.intelligence = json.dumps([{'type': 'intelligence', 'value': {'base': 18, 'per_level': 1.5}}])
+            hero.agility = json.dumps([{'type': 'agility', 'value': {'base': 20, 'per_level': 2.0}}])
+            hero.strength = json.dumps([{'type': 'strength', 'value': {'base': 22, 'per_level': 2.5}}])
+            hero.damage = json.dumps([{'type': 'damage', 'value': {'min': 40, 'max': 46}}])
+            hero.move_speed = json.dumps([{'type': 'move_speed', 'value': {'speed': 300}}])
+            hero.armor = json.dumps([{'type': 'armor', 'value': {'armor': 1.5}}])
+            hero.save()
+            hero.attack_types.set([attack_types[i % 2]])
+
+    def get_heroes(self, limit):
+        response = self.client.get('/api/v2/heroes/', {
+            'limit': limit, 'fields': 'hero_attack_types,hero_roles,hero_abilities',
+        })
+        self.assertEqual(response.status_code, 200)
+        return response.json()['items']
+
+    def test_listing_query_count_does_not_grow_with_heroes(self):
+        # the first request builds the process-wide facet index
+        self.get_heroes(1)
+        with self.assertNumQueries(self.query_count):
+            self.assertEqual(len(self.get_heroes(10)), 10)
+        with self.assertNumQueries(self.query_count):
+            self.assertEqual(len(self.get_heroes(self.hero_count)), self.hero_count)
+
+
+class ServeMediaTest(TestCase):
+    def test_missing_file_is_not_found(self):
+        media = get_media_model().objects.create(
+            title='missing', type='video', file='media/missing.mp4', duration=1
+        )
+        for method in ('get', 'head'):
+            # the locale middleware redirects unprefixed 404s before the page router answers
+            response = getattr(self.client, method)('/media-stream/{}/'.format(media.pk), follow=True)
+            self.assertEqual(response.status_code, 404)
+
+
+class ImageFormatTest(SimpleTestCase):
+    def get_image_format(self, accept):
+        return image_formats.get_image_format(RequestFactory().get('/', HTTP_ACCEPT=accept))
+
+    def test_webp_is_negotiated_from_accept(self):
+        self.assertEqual(self.get_image_format('image/avif,image/webp,*/*;q=0.8'), image_formats.WEBP)
+        self.assertEqual(self.get_image_format('image/webp;q=0.5'), image_formats.WEBP)
+        self.assertIsNone(self.get_image_format('image/*,*/*;q=0.8'))
+
+    def test_refused_webp_is_not_negotiated(self):
+        self.assertIsNone(self.get_image_format('image/webp;q=0,*/*'))
+        self.assertIsNone(self.get_image_format('image/webp; q=0.0'))
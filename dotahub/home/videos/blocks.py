@@ -1,3 +1,4 @@
+from django.urls import reverse
 from django.utils.html import format_html
 
 from wagtailmedia.blocks import AbstractMediaChooserBlock
@@ -27,5 +28,5 @@ class MediaChooserBlock(AbstractMediaChooserBlock):
             </div>
             '''
 
-        return format_html(player_code, value.file.url)
+        return format_html(player_code, reverse('serve_media', args=[value.id]))
 
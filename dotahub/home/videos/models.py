@@ -0,0 +1,142 @@
+import os
+from datetime import timedelta
+
+from django.core.files import File
+from django.core.files.base import ContentFile
+from django.db import models, transaction
+from django.utils import timezone
+from wagtail.images.models import Image
+
+from . import probing
+
+
+def save_image(file, title):
+    try:
+        image = Image(title=title, file=file)
+        image.save()
+    finally:
+        file.close()
+    return image
+
+
+class VideoProbe(models.Model):
+    # kept apart from the page so publishing a revision never drops the results
+    media = models.OneToOneField(
+        'wagtailmedia.Media', on_delete=models.CASCADE, related_name='probe'
+    )
+    file_name = models.CharField(max_length=255)
+    file_size = models.BigIntegerField()
+    thumbnail = models.ForeignKey(
+        'wagtailimages.Image', null=True, on_delete=models.SET_NULL, related_name='+'
+    )
+    sprite = models.ForeignKey(
+        'wagtailimages.Image', null=True, on_delete=models.SET_NULL, related_name='+'
+    )
+    sprite_tiles = models.PositiveSmallIntegerField(default=0)
+    duration = models.FloatField(null=True)
+    fps = models.FloatField(null=True)
+    width = models.PositiveIntegerField(null=True)
+    height = models.PositiveIntegerField(null=True)
+    codec = models.CharField(max_length=16, blank=True, default='')
+    probed_at = models.DateTimeField(auto_now=True)
+
+    def __str__(self):
+        return 'VideoProbe-{} ({})'.format(self.pk, self.file_name)
+
+    def is_current(self):
+        # a replaced media file is probed again, an unchanged one never is
+        try:
+            return self.file_name == self.media.file.name and self.file_size == self.media.file.size
+        except OSError:
+            return False
+
+    @classmethod
+    def probe(cls, media):
+        metadata = probing.probe(media.file.path)
+        probe = cls.objects.filter(media=media).first() or cls(media=media)
+        old_image_ids = [probe.thumbnail_id, probe.sprite_id]
+        if media.thumbnail:
+            poster = File(media.thumbnail.open('rb'), name=os.path.basename(media.thumbnail.name))
+        else:
+            poster = ContentFile(metadata['poster'], name='thumbnail.jpeg')
+        probe.thumbnail = save_image(poster, media.title)
+        probe.sprite = save_image(
+            ContentFile(metadata['sprite'], name='sprite.jpeg'), '{} sprite'.format(media.title)
+        )
+        probe.sprite_tiles = metadata['sprite_tiles']
+        probe.duration = metadata['duration']
+        probe.fps = metadata['fps']
+        probe.width = metadata['width']
+        probe.height = metadata['height']
+        probe.codec = metadata['codec']
+        probe.file_name = media.file.name
+        probe.file_size = media.file.size
+        probe.save()
+        Image.objects.filter(pk__in=old_image_ids).delete()
+        return probe
+
+
+class ThumbnailJob(models.Model):
+    PENDING = 'pending'
+    RUNNING = 'running'
+    DONE = 'done'
+    FAILED = 'failed'
+    STATUS_CHOICES = [
+        (PENDING, 'Pending'),
+        (RUNNING, 'Running'),
+        (DONE, 'Done'),
+        (FAILED, 'Failed'),
+    ]
+    MAX_ATTEMPTS = 3
+
+    page = models.ForeignKey(
+        'home.ShortVideoPage', on_delete=models.CASCADE, related_name='thumbnail_jobs'
+    )
+    status = models.CharField(
+        max_length=10, choices=STATUS_CHOICES, default=PENDING, db_index=True
+    )
+    attempts = models.PositiveSmallIntegerField(default=0)
+    error = models.TextField(blank=True, default='')
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    def __str__(self):
+        return 'ThumbnailJob-{} ({})'.format(self.pk, self.status)
+
+    @classmethod
+    def enqueue(cls, page):
+        if not cls.objects.filter(page=page, status__in=[cls.PENDING, cls.RUNNING]).exists():
+            cls.objects.create(page=page)
+
+    @classmethod
+    def claim(cls):
+        with transaction.atomic():
+            job = cls.objects.select_for_update(skip_locked=True).filter(
+                status=cls.PENDING
+            ).order_by('id').first()
+            if job is None:
+                return None
+            job.status = cls.RUNNING
+            job.attempts += 1
+            job.save(update_fields=['status', 'attempts', 'updated_at'])
+        return job
+
+    @classmethod
+    def requeue_stale(cls, older_than=timedelta(minutes=10)):
+        # jobs left running by a worker that died
+        return cls.objects.filter(
+            status=cls.RUNNING, updated_at__lt=timezone.now() - older_than
+        ).update(status=cls.PENDING)
+
+    def run(self):
+        try:
+            # pages sharing a media file are probed once
+            if self.page.needs_probing:
+                self.page.probe_video()
+        except Exception as e:
+            self.error = str(e) or type(e).__name__
+            self.status = self.PENDING if self.attempts < self.MAX_ATTEMPTS else self.FAILED
+        else:
+            self.error = ''
+            self.status = self.DONE
+        self.save(update_fields=['status', 'error', 'updated_at'])
@@ -0,0 +1,99 @@
+import math
+
+import cv2
+import numpy as np
+
+
+SEEK_POINTS = 20
+SPRITE_COLUMNS = 5
+SPRITE_TILE_WIDTH = 160
+JPEG_QUALITY = 85
+
+
+def get_codec(clip):
+    fourcc = int(clip.get(cv2.CAP_PROP_FOURCC))
+    return ''.join(chr((fourcc >> 8 * i) & 0xFF) for i in range(4)).strip('\x00 ')
+
+
+def get_seek_positions(frame_count, seek_points):
+    if frame_count <= 0:
+        return [0]
+    # skip the very first and last frames, they are often black or fading
+    positions = np.linspace(0, frame_count - 1, num=seek_points + 2)[1:-1]
+    return sorted(set(positions.astype(int).tolist())) or [0]
+
+
+def score_frames(tiles):
+    # tiles: (n, height, width, 3) uint8 BGR stack
+    gray = tiles.astype(np.float32) @ np.array([0.114, 0.587, 0.299], dtype=np.float32)
+    brightness = gray.mean(axis=(1, 2))
+    sharpness = (
+        np.abs(np.diff(gray, axis=1)).mean(axis=(1, 2)) +
+        np.abs(np.diff(gray, axis=2)).mean(axis=(1, 2))
+    )
+    exposure = np.clip(1 - np.abs(brightness - 128) / 128, 0, 1)
+    return sharpness * exposure
+
+
+def build_sprite(tiles, columns=SPRITE_COLUMNS):
+    count, height, width, channels = tiles.shape
+    rows = math.ceil(count / columns)
+    sprite = np.zeros((rows * height, columns * width, channels), dtype=np.uint8)
+    for i, tile in enumerate(tiles):
+        row, column = divmod(i, columns)
+        sprite[row * height:(row + 1) * height, column * width:(column + 1) * width] = tile
+    return sprite
+
+
+def encode_jpeg(frame):
+    ok, buffer = cv2.imencode('.jpeg', frame, [cv2.IMWRITE_JPEG_QUALITY, JPEG_QUALITY])
+    if not ok:
+        raise ValueError('Could not encode frame')
+    return buffer.tobytes()
+
+
+def probe(path, seek_points=SEEK_POINTS, tile_width=SPRITE_TILE_WIDTH):
+    clip = cv2.VideoCapture(path)
+    if not clip.isOpened():
+        raise ValueError('Could not open {}'.format(path))
+    try:
+        fps = clip.get(cv2.CAP_PROP_FPS) or None
+        frame_count = int(clip.get(cv2.CAP_PROP_FRAME_COUNT))
+        width = int(clip.get(cv2.CAP_PROP_FRAME_WIDTH))
+        height = int(clip.get(cv2.CAP_PROP_FRAME_HEIGHT))
+        tile_size = (tile_width, max(1, round(height * tile_width / width))) if width else None
+
+        # only the small tiles are kept, so memory is bounded by the number of seek points
+        positions, tiles = [], []
+        for position in get_seek_positions(frame_count, seek_points):
+            clip.set(cv2.CAP_PROP_POS_FRAMES, position)
+            ok, frame = clip.read()
+            if not ok:
+                continue
+            if tile_size is None:
+                height, width = frame.shape[:2]
+                tile_size = (tile_width, max(1, round(height * tile_width / width)))
+            positions.append(position)
+            tiles.append(cv2.resize(frame, tile_size, interpolation=cv2.INTER_AREA))
+        if not tiles:
+            raise ValueError('Could not read a frame from {}'.format(path))
+        tiles = np.stack(tiles)
+
+        best = int(np.argmax(score_frames(tiles)))
+        clip.set(cv2.CAP_PROP_POS_FRAMES, positions[best])
+        ok, poster = clip.read()
+        if not ok:
+            poster = tiles[best]
+
+        return {
+            'duration': frame_count / fps if fps and frame_count > 0 else None,
+            'fps': fps,
+            'width': width,
+            'height': height,
+            'codec': get_codec(clip),
+            'poster': encode_jpeg(poster),
+            'sprite': encode_jpeg(build_sprite(tiles)),
+            'sprite_tiles': len(tiles),
+        }
+    finally:
+        clip.release()
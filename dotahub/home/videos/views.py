@@ -0,0 +1,171 @@
+import mimetypes
+import os
+import re
+import uuid
+
+from django.http import FileResponse, Http404, HttpResponse, HttpResponseNotModified, StreamingHttpResponse
+from django.shortcuts import get_object_or_404
+from django.utils.http import http_date, parse_http_date_safe
+from django.views.decorators.http import require_http_methods
+from wagtailmedia.models import get_media_model
+
+
+BLOCK_SIZE = 64 * 1024
+MAX_RANGES = 16
+RANGE_PATTERN = re.compile(r'^\s*(\d*)\s*-\s*(\d*)\s*$')
+
+
+class RangeFile:
+    # reads at most `length` bytes from `start`, the descriptor is left at `start`
+    # so servers using os.sendfile for FileResponse stream exactly the range
+    def __init__(self, file, start, length):
+        self.file = file
+        self.file.seek(start)
+        self.remaining = length
+
+    def fileno(self):
+        return self.file.fileno()
+
+    def read(self, size=-1):
+        if self.remaining <= 0:
+            return b''
+        if size < 0 or size > self.remaining:
+            size = self.remaining
+        data = self.file.read(size)
+        self.remaining -= len(data)
+        return data
+
+    def close(self):
+        self.file.close()
+
+
+def get_etag(stat):
+    return '"{:x}-{:x}"'.format(int(stat.st_mtime), stat.st_size)
+
+
+def parse_ranges(header, size):
+    # returns None when the header should be ignored and [] when no range can be satisfied
+    if not header or not header.startswith('bytes='):
+        return None
+    parts = header[len('bytes='):].split(',')
+    if len(parts) > MAX_RANGES:
+        return None
+    ranges = []
+    for part in parts:
+        match = RANGE_PATTERN.match(part)
+        if match is None:
+            return None
+        start, end = match.groups()
+        if start == '' and end == '':
+            return None
+        if start == '':
+            length = int(end)
+            if length == 0 or size == 0:
+                continue
+            ranges.append((max(size - length, 0), size - 1))
+            continue
+        start = int(start)
+        if end and int(end) < start:
+            return None
+        if start >= size:
+            continue
+        end = min(int(end), size - 1) if end else size - 1
+        ranges.append((start, end))
+    return ranges
+
+
+def is_range_fresh(request, etag, last_modified):
+    if_range = request.META.get('HTTP_IF_RANGE')
+    if not if_range:
+        return True
+    if if_range.startswith('"'):
+        return if_range == etag
+    return parse_http_date_safe(if_range) == last_modified
+
+
+def iter_multipart(path, ranges, boundary, part_headers):
+    with open(path, 'rb') as file:
+        for (start, end), headers in zip(ranges, part_headers):
+            yield headers
+            file.seek(start)
+            remaining = end - start + 1
+            while remaining > 0:
+                data = file.read(min(BLOCK_SIZE, remaining))
+                if not data:
+                    return
+                remaining -= len(data)
+                yield data
+            yield b'\r\n'
+        yield '--{}--\r\n'.format(boundary).encode()
+
+
+def get_multipart_response(path, ranges, size, content_type):
+    boundary = uuid.uuid4().hex
+    part_headers = [
+        '--{}\r\nContent-Type: {}\r\nContent-Range: bytes {}-{}/{}\r\n\r\n'.format(
+            boundary, content_type, start, end, size
+        ).encode()
+        for start, end in ranges
+    ]
+    length = sum(
+        len(headers) + end - start + 1 + 2
+        for (start, end), headers in zip(ranges, part_headers)
+    ) + len('--{}--\r\n'.format(boundary))
+    response = StreamingHttpResponse(
+        iter_multipart(path, ranges, boundary, part_headers), status=206,
+        content_type='multipart/byteranges; boundary={}'.format(boundary)
+    )
+    response['Content-Length'] = length
+    return response
+
+
+def open_media_file(path):
+    # the row may outlive its file, which is a missing resource rather than a server error
+    try:
+        return open(path, 'rb')
+    except OSError:
+        raise Http404
+
+
+@require_http_methods(['GET', 'HEAD'])
+def serve_media(request, media_id):
+    media = get_object_or_404(get_media_model(), id=media_id)
+    path = media.file.path
+    try:
+        stat = os.stat(path)
+    except OSError:
+        raise Http404
+    size = stat.st_size
+    etag = get_etag(stat)
+    last_modified = int(stat.st_mtime)
+    content_type = mimetypes.guess_type(path)[0] or 'application/octet-stream'
+
+    if request.META.get('HTTP_IF_NONE_MATCH') == etag:
+        response = HttpResponseNotModified()
+    else:
+        ranges = None
+        if is_range_fresh(request, etag, last_modified):
+            ranges = parse_ranges(request.META.get('HTTP_RANGE'), size)
+        if ranges == []:
+            response = HttpResponse(status=416)
+            response['Content-Range'] = 'bytes */{}'.format(size)
+        elif request.method == 'HEAD':
+            response = HttpResponse(content_type=content_type)
+            response['Content-Length'] = size
+        elif ranges is None:
+            response = FileResponse(open_media_file(path), content_type=content_type)
+            response['Content-Length'] = size
+        elif len(ranges) == 1:
+            start, end = ranges[0]
+            response = FileResponse(
+                RangeFile(open_media_file(path), start, end - start + 1),
+                status=206, content_type=content_type
+            )
+            response['Content-Length'] = end - start + 1
+            response['Content-Range'] = 'bytes {}-{}/{}'.format(start, end, size)
+        else:
+            response = get_multipart_response(path, ranges, size, content_type)
+    response['Accept-Ranges'] = 'bytes'
+    response['ETag'] = etag
+    response['Last-Modified'] = http_date(last_modified)
+    return response
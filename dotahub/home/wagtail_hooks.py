@@ -0,0 +1,10 @@
+from wagtail.core import hooks
+
+from .modules import image_formats
+
+
+@hooks.register('register_image_operations')
+def register_image_operations():
+    return [
+        ('webpquality', image_formats.WebPQualityOperation),
+    ]
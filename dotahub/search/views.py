@@ -1,9 +1,12 @@
 from django.core.paginator import EmptyPage, PageNotAnInteger, Paginator
+from django.http import JsonResponse
 from django.shortcuts import render
 
 from wagtail.core.models import Page
 from wagtail.search.models import Query
 
+from home.heroes.autocomplete import get_autocomplete_index
+
 
 def search(request):
     search_query = request.GET.get('query', None)
@@ -32,3 +35,11 @@ def search(request):
         'search_query': search_query,
         'search_results': search_results,
     })
+
+
+def autocomplete(request):
+    query = request.GET.get('query', '')
+    return JsonResponse({
+        'query': query,
+        'results': get_autocomplete_index().search(query),
+    })